@@ -36,10 +36,13 @@ def detect_patterns(
     # Calculate average volume for confirmation
     avg_volume = df['volume'].rolling(20).mean()
 
+    # Per-bar OHLC lookups, built once - df.iloc[idx] would build a Series per call
+    candles = _candles(df)
+
     # Detect each pattern type
     for idx in range(len(df)):
         if 'engulfing' in patterns:
-            pattern = _detect_engulfing(df, idx)
+            pattern = _detect_engulfing(df, idx, candles)
             if pattern:
                 pattern['volume_confirmed'] = _check_volume_confirmation(
                     df, idx, avg_volume, require_volume_confirmation
@@ -47,7 +50,7 @@ def detect_patterns(
                 detected.append(pattern)
 
         if 'pinbar' in patterns or 'hammer' in patterns or 'shooting_star' in patterns:
-            pattern = _detect_pinbar(df, idx)
+            pattern = _detect_pinbar(df, idx, candles)
             if pattern:
                 pattern['volume_confirmed'] = _check_volume_confirmation(
                     df, idx, avg_volume, require_volume_confirmation
@@ -55,7 +58,7 @@ def detect_patterns(
                 detected.append(pattern)
 
         if 'doji' in patterns:
-            pattern = _detect_doji(df, idx)
+            pattern = _detect_doji(df, idx, candles)
             if pattern:
                 pattern['volume_confirmed'] = _check_volume_confirmation(
                     df, idx, avg_volume, require_volume_confirmation
@@ -63,7 +66,7 @@ def detect_patterns(
                 detected.append(pattern)
 
         if 'morning_star' in patterns or 'evening_star' in patterns:
-            pattern = _detect_star_patterns(df, idx)
+            pattern = _detect_star_patterns(df, idx, candles)
             if pattern:
                 pattern['volume_confirmed'] = _check_volume_confirmation(
                     df, idx, avg_volume, require_volume_confirmation
@@ -71,7 +74,7 @@ def detect_patterns(
                 detected.append(pattern)
 
         if 'three_soldiers' in patterns or 'three_crows' in patterns:
-            pattern = _detect_three_pattern(df, idx)
+            pattern = _detect_three_pattern(df, idx, candles)
             if pattern:
                 pattern['volume_confirmed'] = _check_volume_confirmation(
                     df, idx, avg_volume, require_volume_confirmation
@@ -81,7 +84,13 @@ def detect_patterns(
     return detected
 
 
-def _detect_engulfing(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
+def _candles(df: pd.DataFrame) -> List[Dict[str, float]]:
+    """OHLC of each bar as a dict (numpy float64 values, same as a df.iloc row)."""
+    columns = ('open', 'high', 'low', 'close')
+    return [dict(zip(columns, row)) for row in df[list(columns)].to_numpy(dtype=float)]
+
+
+def _detect_engulfing(df: pd.DataFrame, idx: int, candles: List[Dict[str, float]]) -> Optional[Dict[str, Any]]:
     """
     Detect bullish/bearish engulfing patterns.
 
@@ -91,8 +100,8 @@ def _detect_engulfing(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
     if idx < 1 or idx >= len(df):
         return None
 
-    curr = df.iloc[idx]
-    prev = df.iloc[idx - 1]
+    curr = candles[idx]
+    prev = candles[idx - 1]
 
     curr_body = abs(curr['close'] - curr['open'])
     prev_body = abs(prev['close'] - prev['open'])
@@ -127,7 +136,7 @@ def _detect_engulfing(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _calculate_engulfing_strength(curr: pd.Series, prev: pd.Series) -> float:
+def _calculate_engulfing_strength(curr: Dict[str, float], prev: Dict[str, float]) -> float:
     """Calculate engulfing pattern strength (0-100)."""
     curr_body = abs(curr['close'] - curr['open'])
     prev_body = abs(prev['close'] - prev['open'])
@@ -153,7 +162,7 @@ def _calculate_engulfing_strength(curr: pd.Series, prev: pd.Series) -> float:
     return min(100, strength)
 
 
-def _detect_pinbar(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
+def _detect_pinbar(df: pd.DataFrame, idx: int, candles: List[Dict[str, float]]) -> Optional[Dict[str, Any]]:
     """
     Detect pin bar / hammer / shooting star patterns.
 
@@ -164,7 +173,7 @@ def _detect_pinbar(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
     if idx < 1 or idx >= len(df):
         return None
 
-    candle = df.iloc[idx]
+    candle = candles[idx]
     body = abs(candle['close'] - candle['open'])
     full_range = candle['high'] - candle['low']
 
@@ -244,7 +253,7 @@ def _calculate_pinbar_strength(body_pct: float, long_wick_pct: float, short_wick
     return min(100, body_score + wick_score + opposite_score)
 
 
-def _detect_doji(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
+def _detect_doji(df: pd.DataFrame, idx: int, candles: List[Dict[str, float]]) -> Optional[Dict[str, Any]]:
     """
     Detect doji patterns (indecision candles).
 
@@ -254,7 +263,7 @@ def _detect_doji(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
     if idx >= len(df):
         return None
 
-    candle = df.iloc[idx]
+    candle = candles[idx]
     body = abs(candle['close'] - candle['open'])
     full_range = candle['high'] - candle['low']
 
@@ -277,7 +286,7 @@ def _detect_doji(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _detect_star_patterns(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
+def _detect_star_patterns(df: pd.DataFrame, idx: int, candles: List[Dict[str, float]]) -> Optional[Dict[str, Any]]:
     """
     Detect morning star (bullish) and evening star (bearish) patterns.
 
@@ -287,9 +296,9 @@ def _detect_star_patterns(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]
     if idx < 2 or idx >= len(df):
         return None
 
-    candle1 = df.iloc[idx - 2]  # First candle
-    candle2 = df.iloc[idx - 1]  # Star (middle)
-    candle3 = df.iloc[idx]      # Third candle
+    candle1 = candles[idx - 2]  # First candle
+    candle2 = candles[idx - 1]  # Star (middle)
+    candle3 = candles[idx]      # Third candle
 
     body1 = abs(candle1['close'] - candle1['open'])
     body2 = abs(candle2['close'] - candle2['open'])
@@ -340,7 +349,7 @@ def _detect_star_patterns(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]
 
 
 def _calculate_star_strength(body1: float, body2: float, body3: float,
-                             close3: float, candle1: pd.Series) -> float:
+                             close3: float, candle1: Dict[str, float]) -> float:
     """Calculate morning/evening star strength."""
     # Large outer candles
     size_score = min((body1 + body3) / body2, 10) * 5  # Max 50
@@ -359,7 +368,7 @@ def _calculate_star_strength(body1: float, body2: float, body3: float,
     return min(100, size_score + star_score + penetration_score)
 
 
-def _detect_three_pattern(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]]:
+def _detect_three_pattern(df: pd.DataFrame, idx: int, candles: List[Dict[str, float]]) -> Optional[Dict[str, Any]]:
     """
     Detect three white soldiers (bullish) and three black crows (bearish).
 
@@ -369,9 +378,9 @@ def _detect_three_pattern(df: pd.DataFrame, idx: int) -> Optional[Dict[str, Any]
     if idx < 2 or idx >= len(df):
         return None
 
-    candle1 = df.iloc[idx - 2]
-    candle2 = df.iloc[idx - 1]
-    candle3 = df.iloc[idx]
+    candle1 = candles[idx - 2]
+    candle2 = candles[idx - 1]
+    candle3 = candles[idx]
 
     # Three white soldiers (bullish continuation)
     if (candle1['close'] > candle1['open'] and
@@ -663,7 +663,7 @@ if __name__ == "__main__":
     df = yf.download(ticker, period="1mo", interval="1d", progress=False)
 
     # Standardize columns
-    df.columns = [str(col).lower() for col in df.columns]
+    df.columns = df.columns.astype(str).str.lower()
 
     # Detect exit patterns for a CALL position in 25% profit
     exit_signals = detect_exit_patterns(
@@ -112,7 +112,7 @@ def get_fib_analysis(
             df = yf.download(ticker, period="3mo", interval="1d", progress=False)
             if isinstance(df.columns, pd.MultiIndex):
                 df.columns = df.columns.get_level_values(0)
-            df.columns = [str(col).lower() for col in df.columns]
+            df.columns = df.columns.astype(str).str.lower()
         except Exception:
             return None
 
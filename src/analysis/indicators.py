@@ -0,0 +1,48 @@
+"""
+Indicator Kernels
+Array-level indicator math shared by the CLI tools and test scripts
+"""
+
+import numpy as np
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True Range per bar: max(H-L, |H-prev_close|, |L-prev_close|).
+
+    The first bar has no prior close, so its TR is just H-L.
+
+    Args:
+        high, low, close: float64 price arrays of equal length
+
+    Returns:
+        float64 array of true range values
+    """
+    prev_close = np.empty_like(high)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+
+    # Two buffers, everything else in place
+    tr = np.subtract(high, low)
+    gap = np.subtract(high, prev_close)
+    np.abs(gap, out=gap)
+    np.fmax(tr, gap, out=tr)
+    np.subtract(low, prev_close, out=gap)
+    np.abs(gap, out=gap)
+    np.fmax(tr, gap, out=tr)
+    return tr
+
+
+def latest_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> float:
+    """
+    ATR at the last bar (simple mean of the final `period` true ranges).
+
+    Same value as ``true_range.rolling(period).mean().iloc[-1]`` without
+    building the intermediate Series.
+
+    Returns:
+        ATR in price units, or NaN if fewer than `period` bars
+    """
+    if len(high) < period:
+        return np.nan
+    return true_range(high, low, close)[-period:].mean()
@@ -258,7 +258,11 @@ def calculate_support_resistance_zones(
             # Handle timezone-aware index
             if df.index.tz is not None:
                 cutoff_date = pd.Timestamp(cutoff_date).tz_localize(df.index.tz)
-            df = df[df.index >= cutoff_date]
+            if df.index.is_monotonic_increasing:
+                # Sorted bars: the window is a tail slice, no boolean mask needed
+                df = df.iloc[df.index.searchsorted(cutoff_date, side='left'):]
+            else:
+                df = df[df.index >= cutoff_date]
 
     # Find swing points
     swing_highs, swing_lows = find_swing_highs_lows(df, window=swing_window)
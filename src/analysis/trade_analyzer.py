@@ -73,9 +73,14 @@ class TradeAnalyzer:
         current_price: float = None,
         market_context: Optional[Dict[str, Any]] = None,
         option_live_price: float = None,
+        *,
+        score_only: bool = False,
     ) -> AnalysisResult:
         """
         Perform full AI analysis of a trade.
+
+        With score_only=True the LLM-enhanced narrative is skipped (those
+        fields stay None) - for callers that only compare flags and scores.
         """
         if not self.enabled:
             return AnalysisResult(
@@ -112,15 +117,18 @@ class TradeAnalyzer:
         )
 
         # Generate LLM-enhanced analysis
-        llm_analysis = self._generate_llm_enhanced_analysis(
-            trade=trade,
-            trade_plan=trade_plan,
-            red_flags=red_flags,
-            green_flags=green_flags,
-            market_context=market_context,
-            setup_score=setup_score,
-            current_price=current_price
-        )
+        if score_only:
+            llm_analysis = {}
+        else:
+            llm_analysis = self._generate_llm_enhanced_analysis(
+                trade=trade,
+                trade_plan=trade_plan,
+                red_flags=red_flags,
+                green_flags=green_flags,
+                market_context=market_context,
+                setup_score=setup_score,
+                current_price=current_price
+            )
 
         # Get recommendation tier based on score
         tier_label, tier_guidance = self._get_recommendation_tier(setup_score)
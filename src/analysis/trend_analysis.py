@@ -198,10 +198,10 @@ def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
     minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
 
-    # Smooth the values
+    # Smooth the values (DM arrays go back on the frame's index so they line up with ATR)
     atr = tr.rolling(window=period).mean()
-    plus_di = 100 * pd.Series(plus_dm).rolling(window=period).mean() / atr
-    minus_di = 100 * pd.Series(minus_dm).rolling(window=period).mean() / atr
+    plus_di = 100 * pd.Series(plus_dm, index=df.index, copy=False).rolling(window=period).mean() / atr
+    minus_di = 100 * pd.Series(minus_dm, index=df.index, copy=False).rolling(window=period).mean() / atr
 
     # Calculate DX and ADX
     dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
@@ -90,10 +90,10 @@ class JournalAnalyzer:
             )
 
             # Flatten columns if MultiIndex
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = [col[0].lower() for col in df.columns]
-            else:
-                df.columns = [str(col).lower() for col in df.columns]
+            columns = df.columns
+            if isinstance(columns, pd.MultiIndex):
+                columns = columns.get_level_values(0)
+            df.columns = columns.astype(str).str.lower()
 
             return df
 
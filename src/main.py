@@ -17,6 +17,7 @@ from parser.trade_parser import TradeParser, OptionTrade
 from risk_engine.risk_engine import RiskEngine
 from analysis.trade_analyzer import TradeAnalyzer
 from report.report import print_analysis_report
+from utils.config import load_config
 
 # Load .env first so API keys are available everywhere
 def _load_env(repo_root: str) -> None:
@@ -68,10 +69,7 @@ def get_option_play_input(play_parts: list) -> str:
 def _supported_formats(config_path: str) -> list:
     """Load supported format examples from config for error message."""
     try:
-        import yaml
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-        formats = config.get("alert_formats", [])
+        formats = load_config(config_path).get("alert_formats", [])
         return [f.get("example", "") for f in formats if f.get("example")]
     except Exception:
         return [
@@ -139,6 +137,11 @@ def run_analysis(
     """
     parser = TradeParser(config_path)
     trade = parser.parse(play_text)
+    # Parse config once for the whole pipeline
+    try:
+        cfg = load_config(config_path)
+    except Exception:
+        cfg = {}
     if not trade:
         return {
             "ok": False,
@@ -301,9 +304,6 @@ def run_analysis(
                         market_context["probability_of_profit"] = round(pop, 2)
             # Multi-timeframe technical (RSI, MACD, SMA) when enabled
             try:
-                import yaml
-                with open(config_path, "r") as f:
-                    cfg = yaml.safe_load(f) or {}
                 if (cfg.get("analysis") or {}).get("technical", {}).get("enabled", False):
                     from market_data.technical import get_technical_context
                     tech_ctx = get_technical_context(trade.ticker, cfg)
@@ -333,9 +333,6 @@ def run_analysis(
     # IV Rank & realized vol (historical IV from Massive when available; realized from Yahoo)
     if not no_market and trade.ticker:
         try:
-            import yaml
-            with open(config_path, "r") as f:
-                cfg = yaml.safe_load(f)
             iv_cfg = (cfg.get("analysis") or {}).get("iv_rank", {})
             lookback = iv_cfg.get("lookback_days", 365)
             rv_window = iv_cfg.get("realized_vol_window", 30)
@@ -389,9 +386,6 @@ def run_analysis(
     # ATR-based vol-adjusted levels (Yahoo daily OHLC); augments rule-based SL/targets
     if not no_market and trade.ticker:
         try:
-            import yaml
-            with open(config_path, "r") as f:
-                cfg = yaml.safe_load(f)
             atr_cfg = (cfg.get("stops") or {}).get("atr", {})
             period = atr_cfg.get("period", 14)
             days_back = atr_cfg.get("days_back", 60)
@@ -447,9 +441,6 @@ def run_analysis(
     # Enhanced Technical Analysis (Phase 1-4: Price Action, Volume, Patterns, Trend)
     if not no_market and current_price and trade.ticker:
         try:
-            import yaml
-            with open(config_path, "r") as f:
-                cfg = yaml.safe_load(f) or {}
 
             analysis_cfg = cfg.get("analysis", {})
 
@@ -607,10 +598,7 @@ def run_analysis(
         market_context["stress_test_iv_proxy"] = "30d realized"
     if current_price and trade.strike and iv_for_stress is not None:
         try:
-            import yaml
             from analysis.greeks import stress_test_scenarios, days_to_years
-            with open(config_path, "r") as f:
-                cfg = yaml.safe_load(f)
             stress_cfg = (cfg.get("analysis") or {}).get("stress", {})
             scenarios = stress_cfg.get("scenarios", [-0.02, -0.01, 0.01, 0.02])
             r = stress_cfg.get("risk_free_rate", 0.05)
@@ -679,9 +667,6 @@ def run_analysis(
     # Second pass: Recalculate position sizing with smart sizing if enabled
     # Now that we have setup_score from analysis, use it for optimal position sizing
     try:
-        import yaml
-        with open(config_path, 'r') as f:
-            cfg = yaml.safe_load(f)
         sizing_config = cfg.get('sizing', {})
 
         if sizing_config.get('method') == 'composite' and hasattr(analysis, 'setup_score'):
@@ -695,7 +680,6 @@ def run_analysis(
             # Recalculate position with smart sizing
             new_position = engine.calculate_position(
                 trade,
-                current_price,
                 setup_score=analysis.setup_score,
                 iv_rank=market_context.get('iv_rank_percentile'),
                 trade_history=market_context.get('trade_history', []),
@@ -201,7 +201,7 @@ def get_historical_data(
         # Standardize column names to lowercase
         if isinstance(df.columns, pd.MultiIndex):
             df.columns = df.columns.get_level_values(0)
-        df.columns = [str(col).lower() for col in df.columns]
+        df.columns = df.columns.astype(str).str.lower()
 
         # Ensure required columns exist
         required = ['open', 'high', 'low', 'close', 'volume']
@@ -334,7 +334,7 @@ def get_enhanced_technical_context(ticker: str) -> Dict[str, Any]:
         # Standardize columns
         if isinstance(df.columns, pd.MultiIndex):
             df.columns = df.columns.get_level_values(0)
-        df.columns = [str(col).lower() for col in df.columns]
+        df.columns = df.columns.astype(str).str.lower()
         
         if 'close' not in df.columns:
             return ctx
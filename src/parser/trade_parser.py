@@ -6,10 +6,21 @@ Supports optional EXP YYYY-MM-DD or EXP MM/DD/YYYY for explicit expiration.
 
 import re
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Pattern
 from datetime import datetime, date, timedelta
 import yaml
 
+# Fixed patterns, compiled once at import
+_DTE_PREFIX_RE = re.compile(r"\bdte\s*(\d+)\b", re.I)
+_DTE_SUFFIX_RE = re.compile(r"\b(\d+)\s*dte\b", re.I)
+_ODE_RE = re.compile(
+    r"0\s*dte|0dte|zero\s*dte"
+    r"|same\s*day|same-day|sameday"
+    r"|today\s*exp|exp\s*today|ode\b"
+)
+_EXP_ISO_RE = re.compile(r"\bexp\s+(\d{4})-(\d{1,2})-(\d{1,2})\b", re.I)
+_EXP_US_RE = re.compile(r"\bexp\s+(\d{1,2})/(\d{1,2})/(\d{2,4})\b", re.I)
+
 
 @dataclass
 class OptionTrade:
@@ -56,7 +67,16 @@ class TradeParser:
         with open(config_path, 'r') as f:
             self.config = yaml.safe_load(f)
         self.formats = self.config.get('alert_formats', [])
-        
+        # Compile each format's pattern once; ones that don't compile are skipped
+        self._format_patterns = [self._compile_pattern(fmt.get('pattern', '')) for fmt in self.formats]
+
+    @staticmethod
+    def _compile_pattern(pattern: str) -> Optional[Pattern]:
+        try:
+            return re.compile(pattern)
+        except re.error:
+            return None
+
     def parse(self, message: str) -> Optional[OptionTrade]:
         """
         Try to parse a Discord message as an options alert.
@@ -65,9 +85,11 @@ class TradeParser:
         Optional: DTE N or N DTE sets days-to-expiration explicitly (single source of truth).
         """
         message = message.strip()
-        for fmt in self.formats:
+        for fmt, pattern in zip(self.formats, self._format_patterns):
+            if pattern is None:
+                continue
             try:
-                trade = self._try_format(message, fmt)
+                trade = self._try_format(message, fmt, pattern)
                 if trade:
                     # 1) Explicit DTE in message (e.g. "DTE 2" or "2 DTE") — universal source
                     explicit_dte = self._parse_explicit_dte(message)
@@ -110,12 +132,11 @@ class TradeParser:
                 continue
         return None
     
-    def _try_format(self, message: str, fmt: Dict) -> Optional[OptionTrade]:
-        """Try parsing with a specific format definition"""
-        pattern = fmt.get('pattern', '')
+    def _try_format(self, message: str, fmt: Dict, pattern: Pattern) -> Optional[OptionTrade]:
+        """Try parsing with a specific format definition (pattern is its compiled regex)"""
         fields = fmt.get('fields', [])
         
-        match = re.search(pattern, message)
+        match = pattern.search(message)
         if not match:
             return None
             
@@ -174,10 +195,10 @@ class TradeParser:
         Supports: DTE N, N DTE (e.g. DTE 2, 2 DTE). Case-insensitive.
         """
         msg = message.strip()
-        m = re.search(r"\bdte\s*(\d+)\b", msg, re.I)
+        m = _DTE_PREFIX_RE.search(msg)
         if m:
             return max(0, int(m.group(1)))
-        m = re.search(r"\b(\d+)\s*dte\b", msg, re.I)
+        m = _DTE_SUFFIX_RE.search(msg)
         if m:
             return max(0, int(m.group(1)))
         return None
@@ -185,14 +206,8 @@ class TradeParser:
     def _detect_ode(self, message: str) -> tuple:
         """Detect same-day expiration (0DTE/ODE). Returns (is_ode, days_to_expiration)."""
         msg_lower = message.lower().strip()
-        ode_patterns = [
-            r"0\s*dte", r"0dte", r"zero\s*dte",
-            r"same\s*day", r"same-day", r"sameday",
-            r"today\s*exp", r"exp\s*today", r"ode\b",
-        ]
-        for pat in ode_patterns:
-            if re.search(pat, msg_lower):
-                return True, 0
+        if _ODE_RE.search(msg_lower):
+            return True, 0
         return False, None
 
     def _parse_expiration(self, message: str) -> Tuple[Optional[str], Optional[int]]:
@@ -202,7 +217,7 @@ class TradeParser:
         """
         msg = message.strip()
         # EXP YYYY-MM-DD
-        m = re.search(r"\bexp\s+(\d{4})-(\d{1,2})-(\d{1,2})\b", msg, re.I)
+        m = _EXP_ISO_RE.search(msg)
         if m:
             y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
             try:
@@ -214,7 +229,7 @@ class TradeParser:
             except ValueError:
                 pass
         # EXP MM/DD/YYYY or MM/DD/YY
-        m = re.search(r"\bexp\s+(\d{1,2})/(\d{1,2})/(\d{2,4})\b", msg, re.I)
+        m = _EXP_US_RE.search(msg)
         if m:
             mo, d, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
             if y < 100:
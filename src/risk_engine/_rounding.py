@@ -0,0 +1,28 @@
+"""
+Rounding helpers shared by the risk engine's batch (array) paths
+"""
+
+import numpy as np
+
+
+def round_half_even(values: np.ndarray, ndigits: int, xp=np) -> np.ndarray:
+    """
+    Vectorized equivalent of the built-in round(x, ndigits) for float arrays.
+
+    np.round scales then rounds, so decimal ties such as 0.405 can land on the
+    other side of the built-in result. The exact rounding error of the scaling
+    product (Veltkamp split) decides those ties, keeping batch results
+    identical to the scalar path. xp is the array module (numpy or cupy).
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    # Veltkamp splitter 2**(p/2) + 1 for the array's precision
+    split = values * (4097.0 if values.dtype == xp.float32 else 134217729.0)
+    hi = split - (split - values)
+    lo = values - hi
+    err = (hi * scale - scaled) + lo * scale
+    rounded = xp.rint(scaled)
+    tie = xp.abs(scaled - xp.trunc(scaled)) == 0.5
+    rounded = xp.where(tie & (err > 0), xp.ceil(scaled), rounded)
+    rounded = xp.where(tie & (err < 0), xp.floor(scaled), rounded)
+    return rounded / scale
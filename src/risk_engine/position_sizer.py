@@ -6,6 +6,13 @@ Kelly Criterion, volatility adjustments, and setup quality-based sizing
 from typing import Dict, Any, Optional, List
 import math
 
+# Correlation groups (simplified) used by the correlation limit check
+_CORRELATION_GROUPS = {
+    'TECH': frozenset({'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA'}),
+    'SPY_RELATED': frozenset({'SPY', 'SPX', 'QQQ', 'DIA', 'IWM'}),
+    'FINANCE': frozenset({'JPM', 'BAC', 'GS', 'MS', 'C'}),
+}
+
 
 class PositionSizer:
     """
@@ -34,6 +41,12 @@ class PositionSizer:
         self.quality_config = self.sizing_config.get('setup_quality', {})
         self.equity_config = self.sizing_config.get('equity_curve', {})
 
+        # Component toggles (resolved once; composite sizing skips disabled components)
+        self.kelly_enabled = self.kelly_config.get('enabled', True)
+        self.volatility_enabled = self.volatility_config.get('enabled', True)
+        self.quality_enabled = self.quality_config.get('enabled', True)
+        self.equity_enabled = self.equity_config.get('enabled', True)
+
         # Risk management limits
         self.risk_config = config.get('risk_management', {})
         self.max_position_pct = self.risk_config.get('limits', {}).get('max_position_pct', 0.25)
@@ -66,7 +79,9 @@ class PositionSizer:
             ticker: Stock symbol for correlation check
 
         Returns:
-            Dict with contracts, risk_pct, sizing breakdown, and reasoning
+            Dict with contracts, risk_pct, sizing breakdown, and reasoning.
+            Per-component values (Kelly %, multipliers) live under
+            result['adjustments'][component], e.g. adjustments['kelly']['kelly_pct'].
         """
         risk_per_contract = abs(entry_price - stop_loss)
 
@@ -113,7 +128,7 @@ class PositionSizer:
 
         # 1. Kelly Criterion adjustment
         kelly_multiplier = 1.0
-        if self.kelly_config.get('enabled', True) and trade_history:
+        if self.kelly_enabled and trade_history:
             kelly_pct = self._calculate_kelly(trade_history)
             if kelly_pct:
                 kelly_multiplier = kelly_pct / base_risk_pct
@@ -124,7 +139,7 @@ class PositionSizer:
 
         # 2. Volatility adjustment
         volatility_multiplier = 1.0
-        if self.volatility_config.get('enabled', True) and iv_rank is not None:
+        if self.volatility_enabled and iv_rank is not None:
             volatility_multiplier = self._calculate_volatility_adjustment(iv_rank)
             adjustments['volatility'] = {
                 'multiplier': round(volatility_multiplier, 2),
@@ -133,7 +148,7 @@ class PositionSizer:
 
         # 3. Setup quality multiplier
         quality_multiplier = 1.0
-        if self.quality_config.get('enabled', True):
+        if self.quality_enabled:
             quality_multiplier = self._calculate_quality_multiplier(setup_score)
             adjustments['setup_quality'] = {
                 'multiplier': round(quality_multiplier, 2),
@@ -142,7 +157,7 @@ class PositionSizer:
 
         # 4. Equity curve adjustment
         equity_multiplier = 1.0
-        if self.equity_config.get('enabled', True) and trade_history:
+        if self.equity_enabled and trade_history:
             equity_multiplier = self._calculate_equity_adjustment(
                 trade_history,
                 current_drawdown_pct
@@ -172,8 +187,8 @@ class PositionSizer:
         # Calculate contracts (options trade in 100-share lots)
         risk_dollars = account_value * final_risk_pct
         risk_per_contract_dollars = risk_per_contract * 100  # Convert to contract risk
-        contracts = int(risk_dollars / risk_per_contract_dollars)
-        contracts = max(1, contracts)  # At least 1 contract
+        risk_contracts = int(risk_dollars / risk_per_contract_dollars)
+        contracts = max(1, risk_contracts)  # At least 1 contract
 
         # Check position size limit (position value = contracts * entry_price * 100)
         position_value = contracts * entry_price * 100
@@ -186,7 +201,7 @@ class PositionSizer:
             adjustments['position_limit'] = {
                 'applied': True,
                 'max_pct': self.max_position_pct,
-                'reduced_from': int(risk_dollars / risk_per_contract_dollars)
+                'reduced_from': risk_contracts
             }
 
         # 6. Correlation check
@@ -216,11 +231,6 @@ class PositionSizer:
             'base_risk_pct': round(base_risk_pct * 100, 2),
             'adjustments': adjustments,
             'reasoning': self._build_sizing_reasoning(adjustments, setup_score),
-            'kelly_pct': adjustments.get('kelly', {}).get('kelly_pct'),
-            'volatility_multiplier': adjustments.get('volatility', {}).get('multiplier'),
-            'setup_multiplier': adjustments.get('setup_quality', {}).get('multiplier'),
-            'equity_multiplier': adjustments.get('equity_curve', {}).get('multiplier'),
-            'drawdown_multiplier': adjustments.get('drawdown', {}).get('multiplier'),
         }
 
     def _calculate_kelly(
@@ -318,12 +328,16 @@ class PositionSizer:
 
         recent_trades = trade_history[-lookback:]
 
-        # Calculate recent win rate
-        wins = len([t for t in recent_trades if t.get('pnl', 0) > 0])
-        recent_win_rate = wins / len(recent_trades)
+        # Recent win count and total R in a single pass
+        wins = 0
+        total_r = 0.0
+        for t in recent_trades:
+            if t.get('pnl', 0) > 0:
+                wins += 1
+            total_r += t.get('r_multiple', 0)
 
-        # Calculate recent average R
-        avg_r = sum(t.get('r_multiple', 0) for t in recent_trades) / len(recent_trades)
+        recent_win_rate = wins / len(recent_trades)
+        avg_r = total_r / len(recent_trades)
 
         # Winning streak: increase size
         # Losing streak: decrease size
@@ -369,18 +383,13 @@ class PositionSizer:
 
         max_correlated_risk = self.risk_config.get('correlation', {}).get('max_correlated_risk_pct', 0.06)
 
-        # Define correlation groups (simplified)
-        correlation_groups = {
-            'TECH': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA'],
-            'SPY_RELATED': ['SPY', 'SPX', 'QQQ', 'DIA', 'IWM'],
-            'FINANCE': ['JPM', 'BAC', 'GS', 'MS', 'C'],
-        }
-
         # Find ticker's group
         ticker_group = None
-        for group, tickers in correlation_groups.items():
+        group_tickers = None
+        for group, tickers in _CORRELATION_GROUPS.items():
             if ticker in tickers:
                 ticker_group = group
+                group_tickers = tickers
                 break
 
         if not ticker_group:
@@ -390,7 +399,7 @@ class PositionSizer:
         group_risk = 0.0
         for pos in open_positions:
             pos_ticker = pos.get('ticker', '')
-            if pos_ticker in correlation_groups.get(ticker_group, []):
+            if pos_ticker in group_tickers:
                 pos_risk = pos.get('risk_dollars', 0)
                 group_risk += pos_risk
 
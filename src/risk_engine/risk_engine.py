@@ -3,13 +3,189 @@ Risk Engine Module
 Deterministic position sizing, stop losses, and target calculation
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional, Tuple
 from datetime import datetime
-import yaml
-
+import functools
+import numpy as np
+
+from risk_engine._rounding import round_half_even
+from utils.config import clear_config_cache as _clear_config_cache, load_config as _load_config
+
+try:
+    from analysis.technical_targets import (
+        get_support_resistance_levels as _get_sr_levels,
+        get_technical_target_recommendation as _get_target_recommendation,
+    )
+except ImportError:  # Technical targets module not available
+    _get_sr_levels = _get_target_recommendation = None
+
+# Optional smart sizing / exit planning managers (resolved once, not per plan)
+try:
+    from risk_engine.position_sizer import PositionSizer as _PositionSizer
+except ImportError:
+    _PositionSizer = None
+try:
+    from risk_engine.partial_exits import PartialExitManager as _PartialExitManager
+except ImportError:
+    _PartialExitManager = None
+try:
+    from risk_engine.trailing_stops import TrailingStopManager as _TrailingStopManager
+except ImportError:
+    _TrailingStopManager = None
+
+# Failures from the optional sizing/exit managers that fall back to the
+# built-in rules (bad inputs or config); anything else is a bug and propagates
+_MANAGER_ERRORS = (ArithmeticError, AttributeError, KeyError, TypeError, ValueError)
+
+# Go/no-go failure flags (GoNoGo.flags)
+REASON_RISK_PCT = 1
+REASON_MIN_PREMIUM = 2
+REASON_SIZE = 4
+REASON_CAPITAL = 8
+
+# Go/no-go failure reasons (bound str.format, so the templates are parsed once)
+_RISK_MSG = "Risk {:.2%} exceeds max {:.2%}".format
+_PREMIUM_MSG = "Premium ${} below minimum ${}".format
+_CONTRACTS_MSG = "Position size calculation resulted in < 1 contract"
+_CAPITAL_MSG = "Position size {:.0f} exceeds 25% of capital".format
+
+# Batches at least this large run the plan kernel on the GPU when CuPy is available
+_GPU_BATCH_THRESHOLD = 100_000
+
+# Optional GPU backend: None until probed, then the cupy module or False
+_CUPY = None
+
+# Stand-in for config sections missing from the file
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+
+def _gpu_backend():
+    """
+    CuPy if it is installed and sees a CUDA device, else None.
 
-@dataclass
+    Probed on the first batch that reaches _GPU_BATCH_THRESHOLD, so importing
+    this module never loads CuPy or touches the driver.
+    """
+    global _CUPY
+    if _CUPY is None:
+        _CUPY = False
+        try:
+            import cupy
+        except ImportError:
+            return None
+        try:
+            if cupy.cuda.runtime.getDeviceCount() > 0:
+                _CUPY = cupy
+        except cupy.cuda.runtime.CUDARuntimeError:
+            pass
+    return _CUPY or None
+
+
+def _safe_divide(num, den: np.ndarray, valid: np.ndarray, xp=np) -> np.ndarray:
+    """num / den where valid, 0 elsewhere (no divide-by-zero warnings)."""
+    return xp.where(valid, num / xp.where(valid, den, 1), 0)
+
+
+def _plan_arrays(
+    premiums: np.ndarray,
+    use_ode: np.ndarray,
+    total_capital: float,
+    max_risk_pct: float,
+    max_positions: int,
+    default_contracts: int,
+    min_premiums: Tuple[float, float],
+    stop_params: Tuple[tuple, tuple],
+    target_params: Tuple[tuple, tuple],
+    pct_target: Optional[float],
+    xp=np,
+) -> tuple:
+    """
+    Array kernel behind RiskEngine.create_trade_plans_batch.
+
+    Takes only arrays and plain numbers (no config dicts or trade objects).
+    Per-row parameters are gathered from the (standard, ODE) pairs by use_ode;
+    pct_target is None when the percentage T1 is disabled. xp is the array
+    module the inputs live in (numpy, or cupy for GPU batches); only ufuncs
+    common to both are used. Float results keep the dtype of premiums
+    (float64 or float32). Intermediates are reused in place via out= to
+    keep temporaries down on large batches.
+
+    Returns:
+        (contracts, risk_percentage, stop_loss, stop_risk_pct, target_1, target_1_r,
+         runner_contracts, runner_target, max_loss_dollars, max_gain_dollars, is_pass)
+    """
+    std_stop, ode_stop = stop_params
+    std_target, ode_target = target_params
+    dtype = premiums.dtype
+    int_dtype = xp.int32 if dtype == xp.float32 else xp.int64
+
+    # Per-row parameters: one gather per column from a (standard, ODE) lookup table
+    lut = xp.asarray([
+        (std_stop[0], ode_stop[0]),
+        (std_stop[1], ode_stop[1]),
+        (std_target[0], ode_target[0]),
+        (std_target[2], ode_target[2]),
+        (std_target[3], ode_target[3]),
+        (min_premiums[0], min_premiums[1]),
+    ], dtype=dtype)
+    idx = use_ode.astype(xp.intp)
+    stop_pct, max_loss_per_contract, profit_target_r, runner_pct, max_runner_r, min_premium = (
+        row.take(idx) for row in lut
+    )
+
+    # Position sizing (fixed percentage)
+    risk_per_contract = premiums * 100
+    valid = risk_per_contract > 0
+    contracts_f = _safe_divide(total_capital * max_risk_pct, risk_per_contract, valid, xp)
+    xp.floor(contracts_f, out=contracts_f)
+    xp.clip(contracts_f, 1, max_positions, out=contracts_f)
+    contracts_f[~valid] = default_contracts
+    contracts = contracts_f.astype(int_dtype)
+    capital_used = contracts_f * premiums * 100
+    risk_percentage = (contracts_f * risk_per_contract) / total_capital
+
+    # Stops: tighter of % of premium and per-contract dollar cap
+    stop_loss = premiums * (1 - stop_pct)
+    dollar_stop = premiums - max_loss_per_contract / 100
+    xp.maximum(stop_loss, dollar_stop, out=stop_loss)
+    entry_risk = premiums - stop_loss
+    stop_risk_pct = _safe_divide(entry_risk * 100, premiums, premiums > 0, xp)
+    max_loss_dollars = round_half_even(contracts_f * entry_risk * 100, 2, xp)
+    stop_loss = round_half_even(stop_loss, 2, xp)
+
+    # Targets (R-based, or percentage T1 when enabled)
+    risk_per_share = premiums - stop_loss
+    target_1 = round_half_even(premiums + risk_per_share * profit_target_r, 2, xp)
+    target_1_r = round_half_even(profit_target_r, 1, xp)
+    if pct_target is not None:
+        pct_target_price = round_half_even(premiums * (1 + pct_target), 2, xp)
+        use_pct = pct_target_price != 0
+        pct_r = _safe_divide(pct_target_price - premiums, risk_per_share, risk_per_share > 0, xp)
+        target_1 = xp.where(use_pct, pct_target_price, target_1)
+        target_1_r = xp.where(use_pct, round_half_even(pct_r, 1, xp), target_1_r)
+    runner_target = round_half_even(
+        premiums + risk_per_share * max_runner_r, 2, xp
+    )
+    runner_contracts = (contracts_f * runner_pct).astype(int_dtype)
+    max_gain_dollars = contracts_f * (target_1 - premiums) * 100
+
+    # Go/No-Go
+    is_pass = ~(
+        (risk_percentage > max_risk_pct)
+        | (premiums < min_premium)
+        | (contracts < 1)
+        | (capital_used > total_capital * 0.25)
+    )
+
+    return (contracts, risk_percentage, stop_loss, round_half_even(stop_risk_pct, 1, xp), target_1,
+            target_1_r, runner_contracts, runner_target, max_loss_dollars,
+            max_gain_dollars, is_pass)
+
+
+@dataclass(slots=True)
 class PositionSize:
     """Calculated position sizing result"""
     contracts: int
@@ -21,7 +197,7 @@ class PositionSize:
     reasoning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TradePlan:
     """Complete trade execution plan"""
     trade: Any  # OptionTrade
@@ -45,31 +221,252 @@ class TradePlan:
     exit_monitoring: Optional[list] = None  # Patterns/signals to monitor for exits
 
 
+class StopInfo(NamedTuple):
+    """Stop loss levels from calculate_stops"""
+    stop_loss: float
+    risk_pct: float
+    max_loss_dollars: float
+    reasoning: str
+
+
+class TargetInfo(NamedTuple):
+    """Profit targets and exit plans from calculate_targets"""
+    target_1: float
+    target_1_r: float
+    target_1_type: str
+    target_1_label: str
+    runner_activated: bool
+    runner_contracts: int
+    runner_target: float
+    max_runner_target_r: float
+    is_technical: bool
+    reasoning: str
+    technical_reasoning: str = ""
+    partial_exit_plan: Optional[Dict[str, Any]] = None
+    trailing_stop_plan: Optional[Dict[str, Any]] = None
+    exit_monitoring: Optional[list] = None
+
+
+class GoNoGo(NamedTuple):
+    """Go/no-go decision from check_go_no_go"""
+    decision: str
+    reasons: list
+    is_pass: bool
+    flags: int = 0  # REASON_* bits that failed
+
+
+@dataclass(slots=True)
+class TradePlanArray:
+    """Batch trade plans stored column-wise (one NumPy array per field)"""
+    premium: np.ndarray
+    contracts: np.ndarray
+    risk_percentage: np.ndarray
+    stop_loss: np.ndarray
+    stop_risk_pct: np.ndarray
+    target_1: np.ndarray
+    target_1_r: np.ndarray
+    runner_contracts: np.ndarray
+    runner_target: np.ndarray
+    max_loss_dollars: np.ndarray
+    max_gain_dollars: np.ndarray
+    is_pass: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.premium)
+
+    def iter_rows(self, trades=None):
+        """
+        Lazily yield a TradePlan per row for callers that need the dataclass.
+
+        Rows carry the rule-based numbers only: reasoning, entry zone,
+        go/no-go reasons and exit plans are left empty.
+        """
+        for i in range(len(self.premium)):
+            premium = float(self.premium[i])
+            contracts = int(self.contracts[i])
+            capital_used = contracts * premium * 100
+            position = PositionSize(
+                contracts=contracts,
+                total_premium=capital_used,
+                max_risk_dollars=contracts * (premium * 100),
+                risk_per_contract=premium * 100,
+                capital_used=capital_used,
+                risk_percentage=float(self.risk_percentage[i]),
+                reasoning="",
+            )
+            yield TradePlan(
+                trade=trades[i] if trades is not None else None,
+                position=position,
+                entry_zone="",
+                stop_loss=float(self.stop_loss[i]),
+                stop_risk_pct=float(self.stop_risk_pct[i]),
+                target_1=float(self.target_1[i]),
+                target_1_r=float(self.target_1_r[i]),
+                runner_activated=True,
+                runner_contracts=int(self.runner_contracts[i]),
+                runner_target=float(self.runner_target[i]),
+                max_loss_dollars=float(self.max_loss_dollars[i]),
+                max_gain_dollars=float(self.max_gain_dollars[i]),
+                go_no_go="GO" if self.is_pass[i] else "NO-GO",
+                go_no_go_reasons=[],
+            )
+
+
 class RiskEngine:
     """
     Deterministic risk management engine.
     All calculations are rule-based - no discretion.
     """
-    
+
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'config', 'account', 'sizing', 'stops', 'targets', 'ode',
+        '_total_capital', '_max_risk_pct', '_max_open_positions', '_sizing_method',
+        '_default_contracts', '_ode_enabled', '_max_risk_dollars', '_max_capital_per_trade',
+        '_min_premiums', '_stop_params', '_target_params', '_pct_target',
+        '_partial_exits_cfg', '_trailing_stops_cfg', '_exit_patterns_cfg',
+        '_partial_exits_enabled', '_trailing_stops_enabled', '_exit_patterns_enabled',
+        '_any_exit_plans', '_trailing_phases', '_breakeven_trigger', '_technical_trailing',
+        '_exit_monitoring', '_exit_monitoring_resistance',
+        '_plan_kernel', '_fixed_sizing', '_stop_levels',
+    )
+
     def __init__(self, config_path: str = "config/config.yaml"):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
-            
-        self.account = self.config.get('account', {})
-        self.sizing = self.config.get('sizing', {})
-        self.stops = self.config.get('stops', {})
-        self.targets = self.config.get('targets', {})
-        self.ode = self.config.get('ode', {})
+        self.config = _load_config(config_path)
+
+        # Sections are read-only views of the shared config (empty when missing)
+        self.account = self.config.get('account', _EMPTY_SECTION)
+        self.sizing = self.config.get('sizing', _EMPTY_SECTION)
+        self.stops = self.config.get('stops', _EMPTY_SECTION)
+        self.targets = self.config.get('targets', _EMPTY_SECTION)
+        self.ode = self.config.get('ode', _EMPTY_SECTION)
+
+        # Resolve per-trade config values once (read on every plan)
+        self._total_capital = self.account.get('total_capital', 100000)
+        self._max_risk_pct = self.account.get('max_risk_per_trade', 0.02)
+        self._max_open_positions = self.account.get('max_open_positions', 5)
+        self._sizing_method = self.sizing.get('method', 'fixed')
+        self._default_contracts = self.sizing.get('default_contracts', 1)
+        self._ode_enabled = bool(self.ode.get('enabled', True))
+        # Derived limits: risk budget per trade, and the 25%-of-capital position cap
+        self._max_risk_dollars = self._total_capital * self._max_risk_pct
+        self._max_capital_per_trade = self._total_capital * 0.25
+
+        # Per-trade parameter tables indexed by _use_ode(trade): [normal, ODE]
+        self._min_premiums = (
+            self.sizing.get('min_premium_to_consider', 0.50),
+            self.ode.get('min_premium', 0.30),
+        )
+        # (stop_pct, max_loss_per_contract)
+        self._stop_params = (
+            (
+                self.stops.get('default_pct', 0.50),
+                self.stops.get('max_loss_per_contract', 500),
+            ),
+            (
+                self.ode.get('stop_pct', 0.35),
+                self.ode.get('max_loss_per_contract', 300),
+            ),
+        )
+        # (profit_target_r, runner_activation_r, runner_remaining_pct, max_runner_target_r)
+        self._target_params = (
+            (
+                self.targets.get('profit_target_r', 2.0),
+                self.targets.get('runner_activation_r', 3.0),
+                self.targets.get('runner_remaining_pct', 0.50),
+                self.targets.get('max_runner_target_r', 5.0),
+            ),
+            (
+                self.ode.get('profit_target_r', 1.5),
+                self.ode.get('runner_activation_r', 2.0),
+                self.ode.get('runner_remaining_pct', 0.50),
+                self.ode.get('max_runner_target_r', 3.0),
+            ),
+        )
+
+        # Percentage T1 (premium * (1 + pct)); None when disabled
+        self._pct_target = None
+        if self.targets.get('target_profit_pct_enabled', False):
+            self._pct_target = self.targets.get('target_profit_pct', 0.20)
+
+        # Exit planning sections and their feature switches
+        self._partial_exits_cfg = self.config.get('partial_exits', _EMPTY_SECTION)
+        self._trailing_stops_cfg = self.config.get('trailing_stops', _EMPTY_SECTION)
+        self._exit_patterns_cfg = self.config.get('exit_patterns', _EMPTY_SECTION)
+        self._partial_exits_enabled = bool(self._partial_exits_cfg.get('enabled', True))
+        self._trailing_stops_enabled = bool(self._trailing_stops_cfg.get('enabled', True))
+        self._exit_patterns_enabled = bool(self._exit_patterns_cfg.get('enabled', True))
+        self._any_exit_plans = (
+            self._partial_exits_enabled or self._trailing_stops_enabled or self._exit_patterns_enabled
+        )
+
+        # Trailing stop plan text depends only on config; shared (read-only) by every plan
+        atr_trailing = self._trailing_stops_cfg.get('atr_trailing', {})
+        self._trailing_phases = MappingProxyType({
+            'initial': f"Trail at {atr_trailing.get('initial_multiplier', 1.5)}x ATR below entry",
+            'mid_profit': f"At 2R+, trail at {atr_trailing.get('mid_multiplier', 2.0)}x ATR",
+            'high_profit': f"At 4R+, trail at {atr_trailing.get('high_multiplier', 2.5)}x ATR"
+        })
+        self._breakeven_trigger = (
+            f"Move to breakeven at {self._trailing_stops_cfg.get('breakeven', {}).get('r_trigger', 2.0)}R"
+        )
+        self._technical_trailing = self._trailing_stops_cfg.get('technical_trailing', {}).get('enabled', True)
+
+        # Exit monitoring suggestions (without / with resistance zones in the S/R analysis)
+        self._exit_monitoring = self._exit_monitoring_resistance = ()
+        if self._exit_patterns_enabled:
+            self._exit_monitoring = (
+                "Monitor for reversal patterns (evening star, shooting star, bearish engulfing)",
+                f"Watch for volume spikes >{self._exit_patterns_cfg.get('volume_spike_threshold', 1.5)}x average",
+            )
+            self._exit_monitoring_resistance = self._exit_monitoring + (
+                "Watch for rejection at resistance levels",
+            )
+
+        # Batch kernel specialized to this engine's config profile
+        self._plan_kernel = functools.partial(
+            _plan_arrays,
+            total_capital=self._total_capital,
+            max_risk_pct=self._max_risk_pct,
+            max_positions=self._max_open_positions,
+            default_contracts=self._default_contracts,
+            min_premiums=self._min_premiums,
+            stop_params=self._stop_params,
+            target_params=self._target_params,
+            pct_target=self._pct_target,
+        )
+
+        # Premium-only results are pure given the config; memoize per engine
+        # (repeated quotes in signal streams, backtest sweeps)
+        self._fixed_sizing = functools.lru_cache(maxsize=4096)(self._compute_fixed_sizing)
+        self._stop_levels = functools.lru_cache(maxsize=4096)(self._compute_stop_levels)
+
+    @classmethod
+    def clear_config_cache(cls) -> None:
+        """
+        Drop parsed configs shared between engines, and their JSON copies, so the
+        next engine re-parses its YAML (tests, forced reloads).
+        """
+        _clear_config_cache()
+
+    def clear_caches(self) -> None:
+        """
+        Drop this engine's memoized sizing and stop results (frees memory in
+        long-lived engines).
+        """
+        self._fixed_sizing.cache_clear()
+        self._stop_levels.cache_clear()
     
     def calculate_position(
         self,
         trade,
-        current_price: float = None,
         setup_score: Optional[int] = None,
         iv_rank: Optional[float] = None,
         trade_history: Optional[list] = None,
         current_drawdown_pct: float = 0.0,
-        stop_loss: Optional[float] = None
+        stop_loss: Optional[float] = None,
+        verbose: bool = True,
+        use_ode: Optional[bool] = None
     ) -> PositionSize:
         """
         Calculate optimal contract count based on risk parameters.
@@ -80,36 +477,34 @@ class RiskEngine:
 
         Args:
             trade: OptionTrade object
-            current_price: Current underlying price
             setup_score: Setup quality score (0-100) from TradeAnalyzer
             iv_rank: IV rank percentile (0-100)
             trade_history: List of recent trades for Kelly calculation
             current_drawdown_pct: Current account drawdown percentage
             stop_loss: Stop loss price (for risk calculation)
+            verbose: Build the human-readable reasoning string (skip in backtests)
+            use_ode: Precomputed _use_ode(trade) (resolved from the trade if None)
         """
-        total_capital = self.account.get('total_capital', 100000)
-        risk_per_contract = trade.premium * 100
-
-        # Check if smart sizing is enabled
-        sizing_config = self.sizing if hasattr(self, 'sizing') else self.config.get('sizing', {})
-        sizing_method = sizing_config.get('method', 'fixed')
+        premium = trade.premium
+        total_capital = self._total_capital
+        risk_per_contract = premium * 100
 
         # Use smart PositionSizer if configured and setup_score available
-        if sizing_method == 'composite' and setup_score is not None:
+        if self._sizing_method == 'composite' and setup_score is not None and _PositionSizer is not None:
             try:
-                from risk_engine.position_sizer import PositionSizer
-
-                sizer = PositionSizer(self.config)
+                sizer = _PositionSizer(self.config)
 
                 # Calculate stop loss if not provided
                 if stop_loss is None:
-                    stop_pct = self._get_stop_params(trade)[0]
-                    stop_loss = trade.premium * (1 - stop_pct)
+                    if use_ode is None:
+                        use_ode = self._use_ode(trade)
+                    stop_pct = self._stop_params[use_ode][0]
+                    stop_loss = premium * (1 - stop_pct)
 
                 # Call smart position sizer
                 result = sizer.calculate_position_size(
                     account_value=total_capital,
-                    entry_price=trade.premium,
+                    entry_price=premium,
                     stop_loss=stop_loss,
                     setup_score=setup_score,
                     trade_history=trade_history or [],
@@ -119,36 +514,39 @@ class RiskEngine:
 
                 # Convert PositionSizer result to PositionSize dataclass
                 contracts = result['contracts']
-                total_premium = contracts * trade.premium * 100
+                total_premium = contracts * premium * 100
                 capital_used = total_premium
                 actual_risk_pct = result['risk_pct']
                 max_risk_dollars = contracts * risk_per_contract
 
-                # Build detailed reasoning from all components
-                reasoning_parts = [f"Smart sizing (score: {setup_score})"]
+                reasoning = ""
+                if verbose:
+                    # Build detailed reasoning from all components
+                    reasoning_parts = [f"Smart sizing (score: {setup_score})"]
 
-                # Safely get multipliers, handling None values
-                kelly_pct = result.get('kelly_pct')
-                if kelly_pct:
-                    reasoning_parts.append(f"Kelly: {kelly_pct:.1%}")
+                    # Safely get multipliers, handling missing components
+                    adjustments = result.get('adjustments', {})
+                    kelly_pct = adjustments.get('kelly', {}).get('kelly_pct')
+                    if kelly_pct:
+                        reasoning_parts.append(f"Kelly: {kelly_pct:.1f}%")
 
-                vol_mult = result.get('volatility_multiplier') or 1.0
-                if vol_mult != 1.0:
-                    reasoning_parts.append(f"IV adj: {vol_mult:.2f}x")
+                    vol_mult = adjustments.get('volatility', {}).get('multiplier') or 1.0
+                    if vol_mult != 1.0:
+                        reasoning_parts.append(f"IV adj: {vol_mult:.2f}x")
 
-                setup_mult = result.get('setup_multiplier') or 1.0
-                if setup_mult != 1.0:
-                    reasoning_parts.append(f"Quality: {setup_mult:.2f}x")
+                    setup_mult = adjustments.get('setup_quality', {}).get('multiplier') or 1.0
+                    if setup_mult != 1.0:
+                        reasoning_parts.append(f"Quality: {setup_mult:.2f}x")
 
-                equity_mult = result.get('equity_multiplier') or 1.0
-                if equity_mult != 1.0:
-                    reasoning_parts.append(f"Equity: {equity_mult:.2f}x")
+                    equity_mult = adjustments.get('equity_curve', {}).get('multiplier') or 1.0
+                    if equity_mult != 1.0:
+                        reasoning_parts.append(f"Equity: {equity_mult:.2f}x")
 
-                dd_mult = result.get('drawdown_multiplier') or 1.0
-                if dd_mult != 1.0:
-                    reasoning_parts.append(f"DD: {dd_mult:.2f}x")
+                    dd_mult = adjustments.get('drawdown', {}).get('multiplier') or 1.0
+                    if dd_mult != 1.0:
+                        reasoning_parts.append(f"DD: {dd_mult:.2f}x")
 
-                reasoning = " | ".join(reasoning_parts) + f" → {contracts} contracts"
+                    reasoning = " | ".join(reasoning_parts) + f" → {contracts} contracts"
 
                 return PositionSize(
                     contracts=contracts,
@@ -160,14 +558,31 @@ class RiskEngine:
                     reasoning=reasoning
                 )
 
-            except Exception as e:
+            except _MANAGER_ERRORS as e:
                 # Fallback to fixed sizing if PositionSizer fails
                 print(f"Warning: Smart sizing failed ({e}), using fixed sizing")
-                pass
 
-        # Fallback: Fixed percentage sizing (original logic)
-        max_risk_pct = self.account.get('max_risk_per_trade', 0.02)
-        max_risk_dollars = total_capital * max_risk_pct
+        # Fallback: Fixed percentage sizing (original logic); reasoning is memoized with the count
+        contracts, reasoning = self._fixed_sizing(premium)
+
+        total_premium = contracts * premium * 100
+        capital_used = total_premium  # For long options, premium = capital at risk initially
+        actual_risk_pct = (contracts * risk_per_contract) / total_capital
+
+        return PositionSize(
+            contracts=contracts,
+            total_premium=total_premium,
+            max_risk_dollars=contracts * risk_per_contract,
+            risk_per_contract=risk_per_contract,
+            capital_used=capital_used,
+            risk_percentage=actual_risk_pct,
+            reasoning=reasoning
+        )
+    
+    def _compute_fixed_sizing(self, premium: float) -> Tuple[int, str]:
+        """Fixed percentage sizing for one premium. Returns (contracts, reasoning)."""
+        risk_per_contract = premium * 100
+        max_risk_dollars = self._max_risk_dollars
 
         # Calculate contracts based on risk
         if risk_per_contract > 0:
@@ -179,86 +594,60 @@ class RiskEngine:
             contracts = max(contracts, min_contracts)
 
             # Check max position limit
-            max_positions = self.account.get('max_open_positions', 5)
+            max_positions = self._max_open_positions
             if contracts > max_positions:
                 contracts = max_positions
                 reasoning = f"Capped at {max_positions} contracts (max positions)"
             else:
                 reasoning = f"Fixed sizing: ${max_risk_dollars:.0f} risk / ${risk_per_contract:.0f} per contract = {raw_contracts:.1f} → {contracts}"
         else:
-            contracts = sizing_config.get('default_contracts', 1)
+            contracts = self._default_contracts
             reasoning = "Could not calculate risk - using default"
 
-        total_premium = contracts * trade.premium * 100
-        capital_used = total_premium  # For long options, premium = capital at risk initially
-        actual_risk_pct = (contracts * risk_per_contract) / total_capital
-
-        return PositionSize(
-            contracts=contracts,
-            total_premium=total_premium,
-            max_risk_dollars=contracts * risk_per_contract,
-            risk_per_contract=risk_per_contract,
-            capital_used=capital_used,
-            risk_percentage=actual_risk_pct,
-            reasoning=reasoning
-        )
-    
-    def _get_stop_params(self, trade) -> tuple:
-        """Return (stop_pct, max_loss_per_contract) — use ODE params if same-day expiration."""
-        use_ode = getattr(trade, "is_ode", False) and self.ode.get("enabled", True)
-        if use_ode:
-            return (
-                self.ode.get("stop_pct", 0.35),
-                self.ode.get("max_loss_per_contract", 300),
-            )
-        return (
-            self.stops.get("default_pct", 0.50),
-            self.stops.get("max_loss_per_contract", 500),
-        )
+        return contracts, reasoning
 
-    def calculate_stops(self, trade, position: PositionSize, current_price: float = None) -> Dict[str, float]:
+    def _compute_stop_levels(self, premium: float, use_ode: bool) -> Tuple[float, float, float, str]:
         """
-        Calculate stop loss levels. Uses tighter ODE params for same-day expiration.
+        Stop for one premium. Returns (stop_loss, risk_pct, entry_risk, reasoning);
+        stop_loss and risk_pct are rounded for output, entry_risk is exact.
         """
-        stop_pct, max_loss_per_contract = self._get_stop_params(trade)
+        stop_pct, max_loss_per_contract = self._stop_params[use_ode]
 
         # Calculate stop based on premium
-        premium_stop = trade.premium * (1 - stop_pct)
+        premium_stop = premium * (1 - stop_pct)
 
         # Calculate stop based on max loss cap
-        dollar_stop = trade.premium - (max_loss_per_contract / 100)
+        dollar_stop = premium - (max_loss_per_contract / 100)
 
         # Use whichever is tighter (more conservative)
         stop_loss = max(premium_stop, dollar_stop)
 
         # Calculate risk percentage
-        entry_risk = trade.premium - stop_loss
-        risk_pct = (entry_risk / trade.premium) * 100 if trade.premium > 0 else 0
-
-        return {
-            "stop_loss": round(stop_loss, 2),
-            "risk_pct": round(risk_pct, 1),
-            "max_loss_dollars": round(position.contracts * (trade.premium - stop_loss) * 100, 2),
-            "reasoning": f"Stop at ${stop_loss:.2f} ({risk_pct:.1f}% of premium)"
-        }
-    
-    def _get_target_params(self, trade) -> tuple:
-        """Return target params — use ODE params if same-day expiration."""
-        use_ode = getattr(trade, "is_ode", False) and self.ode.get("enabled", True)
-        if use_ode:
-            return (
-                self.ode.get("profit_target_r", 1.5),
-                self.ode.get("runner_activation_r", 2.0),
-                self.ode.get("runner_remaining_pct", 0.50),
-                self.ode.get("max_runner_target_r", 3.0),
-            )
-        return (
-            self.targets.get("profit_target_r", 2.0),
-            self.targets.get("runner_activation_r", 3.0),
-            self.targets.get("runner_remaining_pct", 0.50),
-            self.targets.get("max_runner_target_r", 5.0),
-        )
+        entry_risk = premium - stop_loss
+        risk_pct = (entry_risk / premium) * 100 if premium > 0 else 0
+
+        reasoning = f"Stop at ${stop_loss:.2f} ({risk_pct:.1f}% of premium)"
+        return round(stop_loss, 2), round(risk_pct, 1), entry_risk, reasoning
+
+    def _use_ode(self, trade) -> bool:
+        """True if the trade is same-day expiration and ODE rules are enabled."""
+        return self._ode_enabled and bool(getattr(trade, "is_ode", False))
 
+    def calculate_stops(self, trade, position: PositionSize, use_ode: Optional[bool] = None) -> StopInfo:
+        """
+        Calculate stop loss levels. Uses tighter ODE params for same-day expiration.
+        """
+        if use_ode is None:
+            use_ode = self._use_ode(trade)
+        stop_loss, risk_pct, entry_risk, reasoning = self._stop_levels(trade.premium, use_ode)
+
+        return StopInfo(
+            stop_loss=stop_loss,
+            risk_pct=risk_pct,
+            max_loss_dollars=round(position.contracts * entry_risk * 100, 2),
+            reasoning=reasoning,
+        )
+    
     def _generate_exit_plans(
         self,
         trade,
@@ -266,6 +655,7 @@ class RiskEngine:
         stop_loss: float,
         atr: Optional[float],
         sr_zones: Optional[Dict],
+        option_type: str = "CALL",
     ) -> tuple:
         """
         Generate partial exit plan and trailing stop plan.
@@ -275,98 +665,82 @@ class RiskEngine:
         """
         partial_exit_plan = None
         trailing_stop_plan = None
-        exit_monitoring = []
-
-        # Check if exit planning features are enabled
-        partial_exits_cfg = self.config.get('partial_exits', {})
-        trailing_stops_cfg = self.config.get('trailing_stops', {})
 
         # Generate partial exit plan
-        if partial_exits_cfg.get('enabled', True):
+        if self._partial_exits_enabled and _PartialExitManager is not None:
             try:
-                from risk_engine.partial_exits import PartialExitManager
-                partial_manager = PartialExitManager(self.config)
+                partial_manager = _PartialExitManager(self.config)
                 partial_exit_plan = partial_manager.calculate_partial_exit_plan(
                     entry_price=trade.premium,
                     stop_loss=stop_loss,
                     total_contracts=position.contracts,
-                    option_type=getattr(trade, 'option_type', 'CALL'),
+                    option_type=option_type,
                     sr_zones=sr_zones
                 )
-            except Exception:
-                pass  # Module not available or failed
+            except _MANAGER_ERRORS:
+                pass  # Malformed S/R zones or partial_exits config
+
+        # Generate trailing stop plan (TrailingStopManager takes over once the trade is live)
+        if self._trailing_stops_enabled and atr and _TrailingStopManager is not None:
+            # Initial trailing stop plan (will update as trade progresses)
+            trailing_stop_plan = {
+                'initial_stop': stop_loss,
+                'atr': atr,
+                'phases': self._trailing_phases,
+                'breakeven_trigger': self._breakeven_trigger,
+                'technical_trailing': self._technical_trailing
+            }
 
-        # Generate trailing stop plan
-        if trailing_stops_cfg.get('enabled', True) and atr:
-            try:
-                from risk_engine.trailing_stops import TrailingStopManager
-                trailing_manager = TrailingStopManager(self.config)
-
-                # Initial trailing stop plan (will update as trade progresses)
-                trailing_stop_plan = {
-                    'initial_stop': stop_loss,
-                    'atr': atr,
-                    'phases': {
-                        'initial': f"Trail at {trailing_stops_cfg.get('atr_trailing', {}).get('initial_multiplier', 1.5)}x ATR below entry",
-                        'mid_profit': f"At 2R+, trail at {trailing_stops_cfg.get('atr_trailing', {}).get('mid_multiplier', 2.0)}x ATR",
-                        'high_profit': f"At 4R+, trail at {trailing_stops_cfg.get('atr_trailing', {}).get('high_multiplier', 2.5)}x ATR"
-                    },
-                    'breakeven_trigger': f"Move to breakeven at {trailing_stops_cfg.get('breakeven', {}).get('r_trigger', 2.0)}R",
-                    'technical_trailing': trailing_stops_cfg.get('technical_trailing', {}).get('enabled', True)
-                }
-            except Exception:
-                pass  # Module not available or failed
-
-        # Add exit monitoring suggestions
-        exit_patterns_cfg = self.config.get('exit_patterns', {})
-        if exit_patterns_cfg.get('enabled', True):
-            exit_monitoring.append("Monitor for reversal patterns (evening star, shooting star, bearish engulfing)")
-            exit_monitoring.append(f"Watch for volume spikes >{exit_patterns_cfg.get('volume_spike_threshold', 1.5)}x average")
-            if sr_zones and sr_zones.get('resistance_zones'):
-                exit_monitoring.append("Watch for rejection at resistance levels")
-
-        return partial_exit_plan, trailing_stop_plan, exit_monitoring if exit_monitoring else None
-
-    def calculate_targets(self, trade, stop_info: Dict, position: PositionSize,
+        # Add exit monitoring suggestions (fresh list per plan; the text is built once)
+        if sr_zones and sr_zones.get('resistance_zones'):
+            exit_monitoring = self._exit_monitoring_resistance
+        else:
+            exit_monitoring = self._exit_monitoring
+
+        return partial_exit_plan, trailing_stop_plan, list(exit_monitoring) if exit_monitoring else None
+
+    def calculate_targets(self, trade, stop_info: StopInfo, position: PositionSize,
                           current_price: float = None,
-                          market_context: Dict = None) -> Dict[str, Any]:
+                          market_context: Dict = None,
+                          verbose: bool = True,
+                          use_ode: Optional[bool] = None,
+                          plan_exits: bool = True) -> TargetInfo:
         """
         Calculate profit targets using technical analysis when available.
         Falls back to R-based targets if technical levels unavailable.
         Also generates partial exit plan and trailing stop strategy.
+        With verbose=False the label/reasoning strings are left empty.
+        With plan_exits=False only the rule-based targets are computed; the
+        technical lookup and exit plans are skipped.
         """
-        profit_target_r, runner_activation_r, runner_remaining_pct, max_runner_target_r = self._get_target_params(trade)
+        if use_ode is None:
+            use_ode = self._use_ode(trade)
+        # Use ODE params if same-day expiration
+        profit_target_r, runner_activation_r, runner_remaining_pct, max_runner_target_r = (
+            self._target_params[use_ode]
+        )
+        premium = trade.premium
+        option_type = getattr(trade, "option_type", "CALL")
 
-        stop_loss = stop_info.get('stop_loss', trade.premium * 0.5)
-        risk_per_share = trade.premium - stop_loss
+        stop_loss = stop_info.stop_loss
+        risk_per_share = premium - stop_loss
 
         # Check for percentage-based profit target
-        pct_target_enabled = self.targets.get('target_profit_pct_enabled', False)
-        pct_target = self.targets.get('target_profit_pct', 0.20)
+        pct_target = self._pct_target
 
-        # Get S/R zones for exit planning
+        # Get S/R zones for exit planning and ATR for trailing stops
         sr_zones = None
-        if market_context:
-            sr_zones = market_context.get('sr_analysis')
-
-        # Get ATR for trailing stops
         atr = None
         if market_context:
+            sr_zones = market_context.get('sr_analysis')
             atr = market_context.get('atr')
 
         # Try to get technically-grounded targets
         technical_targets = None
-        if current_price and market_context:
+        if plan_exits and current_price and market_context and _get_sr_levels is not None:
             try:
-                from analysis.technical_targets import (
-                    get_support_resistance_levels,
-                    get_technical_target_recommendation,
-                )
-                
                 # Get S/R levels
-                sr_levels = get_support_resistance_levels(
-                    trade.ticker, current_price, period=20
-                )
+                sr_levels = _get_sr_levels(trade.ticker, current_price, period=20)
                 support_levels = sr_levels.get("support_levels", [])
                 resistance_levels = sr_levels.get("resistance_levels", [])
                 
@@ -375,29 +749,31 @@ class RiskEngine:
                 if iv_percent > 2:
                     iv_percent = iv_percent / 100
                 
-                technical_targets = get_technical_target_recommendation(
+                technical_targets = _get_target_recommendation(
                     trade=trade,
                     current_price=current_price,
-                    entry_premium=trade.premium,
+                    entry_premium=premium,
                     stop_premium=stop_loss,
                     support_levels=support_levels,
                     resistance_levels=resistance_levels,
-                    option_type=getattr(trade, "option_type", "CALL"),
+                    option_type=option_type,
                     days_to_expiration=getattr(trade, "days_to_expiration", 0) or 0,
                     iv_percent=iv_percent,
                 )
             except ImportError:
-                pass  # Technical targets module not available
-        
+                pass  # Optional dependency of the technical targets module missing
+
         # Generate exit plans
-        partial_exit_plan, trailing_stop_plan, exit_monitoring = self._generate_exit_plans(
-            trade, position, stop_loss, atr, sr_zones
-        )
+        partial_exit_plan = trailing_stop_plan = exit_monitoring = None
+        if plan_exits and self._any_exit_plans:
+            partial_exit_plan, trailing_stop_plan, exit_monitoring = self._generate_exit_plans(
+                trade, position, stop_loss, atr, sr_zones, option_type
+            )
 
         # If percentage target enabled, calculate it
         pct_target_price = None
-        if pct_target_enabled:
-            pct_target_price = round(trade.premium * (1 + pct_target), 2)
+        if pct_target is not None:
+            pct_target_price = round(premium * (1 + pct_target), 2)
 
         # Use technical targets if available, otherwise use R-based
         if technical_targets and technical_targets.get("conservative_target"):
@@ -408,109 +784,188 @@ class RiskEngine:
             # Determine T1: use percentage target if enabled, else technical
             if pct_target_price:
                 target_1 = pct_target_price
-                target_1_r = round((target_1 - trade.premium) / risk_per_share, 1) if risk_per_share > 0 else 0
+                target_1_r = round((target_1 - premium) / risk_per_share, 1) if risk_per_share > 0 else 0
                 target_1_type = "percentage"
-                target_1_label = f"+{pct_target:.0%} premium"
+                target_1_label = f"+{pct_target:.0%} premium" if verbose else ""
             else:
-                target_1 = cons.get("premium", trade.premium + risk_per_share * profit_target_r)
+                target_1 = round(cons.get("premium", premium + risk_per_share * profit_target_r), 2)
                 target_1_r = cons.get("r_multiple", profit_target_r)
                 target_1_type = "technical"
-                target_1_label = f"{target_1_r}R (technical)"
+                target_1_label = f"{target_1_r}R (technical)" if verbose else ""
+                target_1_r = round(target_1_r, 1)
 
             # Use technical/moderate as runner target
-            runner_target = mod.get("premium", trade.premium + risk_per_share * max_runner_target_r)
-
-            return {
-                "target_1": round(target_1, 2),
-                "target_1_r": round(target_1_r, 1),
-                "target_1_type": target_1_type,
-                "target_1_label": target_1_label,
-                "runner_activated": True,
-                "runner_contracts": int(position.contracts * runner_remaining_pct),
-                "runner_target": round(runner_target, 2),
-                "max_runner_target_r": max_runner_target_r,
-                "technical_reasoning": technical_targets.get("reasoning", ""),
-                "is_technical": True,
-                "reasoning": f"Technical targets: {technical_targets.get('reasoning', 'S/R-based')}",
-                "partial_exit_plan": partial_exit_plan,
-                "trailing_stop_plan": trailing_stop_plan,
-                "exit_monitoring": exit_monitoring,
-            }
+            runner_target = mod.get("premium", premium + risk_per_share * max_runner_target_r)
+
+            return TargetInfo(
+                target_1=target_1,
+                target_1_r=target_1_r,
+                target_1_type=target_1_type,
+                target_1_label=target_1_label,
+                runner_activated=True,
+                runner_contracts=int(position.contracts * runner_remaining_pct),
+                runner_target=round(runner_target, 2),
+                max_runner_target_r=max_runner_target_r,
+                technical_reasoning=technical_targets.get("reasoning", ""),
+                is_technical=True,
+                reasoning=f"Technical targets: {technical_targets.get('reasoning', 'S/R-based')}" if verbose else "",
+                partial_exit_plan=partial_exit_plan,
+                trailing_stop_plan=trailing_stop_plan,
+                exit_monitoring=exit_monitoring,
+            )
 
         # Fallback to R-based targets (or percentage target as T1)
         if pct_target_price:
             target_1 = pct_target_price
-            target_1_r = round((target_1 - trade.premium) / risk_per_share, 1) if risk_per_share > 0 else 0
+            target_1_r = round((target_1 - premium) / risk_per_share, 1) if risk_per_share > 0 else 0
             target_1_type = "percentage"
-            target_1_label = f"+{pct_target:.0%} premium"
+            target_1_label = f"+{pct_target:.0%} premium" if verbose else ""
         else:
-            target_1 = trade.premium + (risk_per_share * profit_target_r)
+            target_1 = round(premium + (risk_per_share * profit_target_r), 2)
             target_1_r = profit_target_r
             target_1_type = "r_based"
-            target_1_label = f"{target_1_r}R"
-
-        runner_target = trade.premium + (risk_per_share * max_runner_target_r)
-
-        return {
-            "target_1": round(target_1, 2),
-            "target_1_r": round(target_1_r, 1) if isinstance(target_1_r, float) else target_1_r,
-            "target_1_type": target_1_type,
-            "target_1_label": target_1_label,
-            "runner_activated": True,
-            "runner_contracts": int(position.contracts * runner_remaining_pct),
-            "runner_target": round(runner_target, 2),
-            "max_runner_target_r": max_runner_target_r,
-            "is_technical": False,
-            "reasoning": f"R-based targets ({profit_target_r}R - {max_runner_target_r}R)" if not pct_target_price else f"+{pct_target:.0%} premium target + R-based runner",
-            "partial_exit_plan": partial_exit_plan,
-            "trailing_stop_plan": trailing_stop_plan,
-            "exit_monitoring": exit_monitoring,
-        }
+            target_1_label = f"{target_1_r}R" if verbose else ""
+            if isinstance(target_1_r, float):
+                target_1_r = round(target_1_r, 1)
+
+        runner_target = premium + (risk_per_share * max_runner_target_r)
+
+        reasoning = ""
+        if verbose:
+            reasoning = f"R-based targets ({profit_target_r}R - {max_runner_target_r}R)" if not pct_target_price else f"+{pct_target:.0%} premium target + R-based runner"
+
+        return TargetInfo(
+            target_1=target_1,
+            target_1_r=target_1_r,
+            target_1_type=target_1_type,
+            target_1_label=target_1_label,
+            runner_activated=True,
+            runner_contracts=int(position.contracts * runner_remaining_pct),
+            runner_target=round(runner_target, 2),
+            max_runner_target_r=max_runner_target_r,
+            is_technical=False,
+            reasoning=reasoning,
+            partial_exit_plan=partial_exit_plan,
+            trailing_stop_plan=trailing_stop_plan,
+            exit_monitoring=exit_monitoring,
+        )
     
-    def check_go_no_go(self, trade, position: PositionSize, current_price: float = None) -> Dict[str, Any]:
+    def check_go_no_go(self, trade, position: PositionSize, use_ode: Optional[bool] = None) -> GoNoGo:
         """
         Rule-based go/no-go evaluation.
         Returns pass/fail with specific reasons.
         """
+        premium = trade.premium
+        max_risk = self._max_risk_pct
+
+        # Minimum premium (ODE allows lower)
+        if use_ode is None:
+            use_ode = self._use_ode(trade)
+        min_prem = self._min_premiums[use_ode]
+
+        # Evaluate every rule into one failure mask; reasons are only
+        # formatted when something failed.
+        # Capital check is simplified - would need to track open positions (max 25% in single trade)
+        fail = (
+            (position.risk_percentage > max_risk) * REASON_RISK_PCT
+            | (premium < min_prem) * REASON_MIN_PREMIUM
+            | (position.contracts < 1) * REASON_SIZE
+            | (position.capital_used > self._max_capital_per_trade) * REASON_CAPITAL
+        )
+        if not fail:
+            return GoNoGo(decision="GO", reasons=[], is_pass=True)
+
         reasons = []
-        passed = True
-        
-        # Check risk percentage
-        max_risk = self.account.get('max_risk_per_trade', 0.02)
-        if position.risk_percentage > max_risk:
-            passed = False
-            reasons.append(f"Risk {position.risk_percentage:.2%} exceeds max {max_risk:.2%}")
-        
-        # Check minimum premium (ODE allows lower)
-        min_prem = self.sizing.get('min_premium_to_consider', 0.50)
-        if getattr(trade, "is_ode", False) and self.ode.get("enabled", True):
-            min_prem = self.ode.get("min_premium", 0.30)
-        if trade.premium < min_prem:
-            reasons.append(f"Premium ${trade.premium} below minimum ${min_prem}")
-            passed = False
-        
-        # Check position size
-        if position.contracts < 1:
-            reasons.append("Position size calculation resulted in < 1 contract")
-            passed = False
-        
-        # Check capital available (simplified - would need to track open positions)
-        total_capital = self.account.get('total_capital', 100000)
-        if position.capital_used > total_capital * 0.25:  # Max 25% in single trade
-            reasons.append(f"Position size {position.capital_used:.0f} exceeds 25% of capital")
-            passed = False
-        
-        return {
-            "decision": "GO" if passed else "NO-GO",
-            "reasons": reasons,
-            "is_pass": passed
-        }
-    
-    def create_trade_plan(self, trade, current_price: float = None, market_context: Dict = None) -> TradePlan:
+        if fail & REASON_RISK_PCT:
+            reasons.append(_RISK_MSG(position.risk_percentage, max_risk))
+        if fail & REASON_MIN_PREMIUM:
+            reasons.append(_PREMIUM_MSG(premium, min_prem))
+        if fail & REASON_SIZE:
+            reasons.append(_CONTRACTS_MSG)
+        if fail & REASON_CAPITAL:
+            reasons.append(_CAPITAL_MSG(position.capital_used))
+
+        return GoNoGo(decision="NO-GO", reasons=reasons, is_pass=False, flags=fail)
+
+    def create_trade_plan(self, trade, current_price: float = None, market_context: Dict = None,
+                          verbose: bool = True) -> TradePlan:
         """
         Create complete trade plan with all calculations.
         Uses technical targets when market_context with S/R levels is available.
         Integrates smart position sizing when setup_score is provided in market_context.
+        Pass verbose=False (backtests) to skip building reasoning strings nobody reads.
+        """
+        position, stop_info, target_info, go_check, entry_zone = self._plan_steps(
+            trade, current_price, market_context, verbose
+        )
+        target_1 = target_info.target_1
+
+        return TradePlan(
+            trade=trade,
+            position=position,
+            entry_zone=entry_zone,
+            stop_loss=stop_info.stop_loss,
+            stop_risk_pct=stop_info.risk_pct,
+            target_1=target_1,
+            target_1_r=target_info.target_1_r,
+            runner_activated=target_info.runner_activated,
+            runner_contracts=target_info.runner_contracts,
+            runner_target=target_info.runner_target,
+            max_loss_dollars=stop_info.max_loss_dollars,
+            max_gain_dollars=position.contracts * (target_1 - trade.premium) * 100,
+            go_no_go=go_check.decision,
+            go_no_go_reasons=go_check.reasons,
+            technical_reasoning=target_info.technical_reasoning,
+            is_technical=target_info.is_technical,
+            partial_exit_plan=target_info.partial_exit_plan,
+            trailing_stop_plan=target_info.trailing_stop_plan,
+            exit_monitoring=target_info.exit_monitoring,
+        )
+
+    def create_trade_plan_into(self, out: TradePlan, trade, current_price: float = None,
+                               market_context: Dict = None, verbose: bool = False) -> TradePlan:
+        """
+        Same as create_trade_plan, but overwrites the fields of an existing plan.
+
+        Lets backtests and sweeps recycle one TradePlan (or a small pool) instead
+        of allocating a new plan per trade. Defaults to verbose=False.
+
+        Returns:
+            out, updated in place
+        """
+        position, stop_info, target_info, go_check, entry_zone = self._plan_steps(
+            trade, current_price, market_context, verbose
+        )
+        target_1 = target_info.target_1
+
+        out.trade = trade
+        out.position = position
+        out.entry_zone = entry_zone
+        out.stop_loss = stop_info.stop_loss
+        out.stop_risk_pct = stop_info.risk_pct
+        out.target_1 = target_1
+        out.target_1_r = target_info.target_1_r
+        out.runner_activated = target_info.runner_activated
+        out.runner_contracts = target_info.runner_contracts
+        out.runner_target = target_info.runner_target
+        out.max_loss_dollars = stop_info.max_loss_dollars
+        out.max_gain_dollars = position.contracts * (target_1 - trade.premium) * 100
+        out.go_no_go = go_check.decision
+        out.go_no_go_reasons = go_check.reasons
+        out.technical_reasoning = target_info.technical_reasoning
+        out.is_technical = target_info.is_technical
+        out.partial_exit_plan = target_info.partial_exit_plan
+        out.trailing_stop_plan = target_info.trailing_stop_plan
+        out.exit_monitoring = target_info.exit_monitoring
+        return out
+
+    def _plan_steps(self, trade, current_price: Optional[float], market_context: Optional[Dict],
+                    verbose: bool) -> tuple:
+        """
+        Run sizing, stops, targets and go/no-go for one trade.
+
+        Returns:
+            tuple: (position, stop_info, target_info, go_check, entry_zone)
         """
         # Extract smart sizing parameters from market_context
         setup_score = None
@@ -520,69 +975,141 @@ class RiskEngine:
 
         if market_context:
             # Get setup_score from analysis (Phase 1-4 integration)
-            analysis_result = market_context.get('analysis_result', {})
+            analysis_result = market_context.get('analysis_result')
             if isinstance(analysis_result, dict):
                 setup_score = analysis_result.get('setup_score')
 
             # Get IV rank from market data
-            iv_rank_pct = market_context.get('iv_rank_percentile')
-            if iv_rank_pct is not None:
-                iv_rank = iv_rank_pct
+            iv_rank = market_context.get('iv_rank_percentile')
 
             # Get trade history if available (from journal or elsewhere)
-            trade_history = market_context.get('trade_history', [])
+            trade_history = market_context.get('trade_history')
 
             # Get current drawdown if tracked
             current_drawdown_pct = market_context.get('current_drawdown_pct', 0.0)
 
+        # Resolve ODE rules once for every step
+        use_ode = self._use_ode(trade)
+
         # Step 1: Position sizing (with smart sizing if setup_score available)
         position = self.calculate_position(
             trade,
-            current_price,
             setup_score=setup_score,
             iv_rank=iv_rank,
             trade_history=trade_history,
-            current_drawdown_pct=current_drawdown_pct
+            current_drawdown_pct=current_drawdown_pct,
+            verbose=verbose,
+            use_ode=use_ode
         )
 
         # Step 2: Stop losses
-        stop_info = self.calculate_stops(trade, position, current_price)
+        stop_info = self.calculate_stops(trade, position, use_ode)
 
-        # Step 3: Targets (pass market_context for technical targets)
-        target_info = self.calculate_targets(trade, stop_info, position, current_price, market_context)
+        # Step 3: Go/No-Go check (needs only the position, so it runs before targets)
+        go_check = self.check_go_no_go(trade, position, use_ode)
 
-        # Step 4: Go/No-Go check
-        go_check = self.check_go_no_go(trade, position, current_price)
+        # Step 4: Targets (pass market_context for technical targets). Quiet callers
+        # skip the technical lookup and exit plans for NO-GO trades.
+        target_info = self.calculate_targets(trade, stop_info, position, current_price, market_context,
+                                             verbose=verbose, use_ode=use_ode,
+                                             plan_exits=verbose or go_check.is_pass)
 
-        # Store technical reasoning and exit plans if available
-        technical_reasoning = target_info.get("technical_reasoning", "")
-        is_technical = target_info.get("is_technical", False)
-        partial_exit_plan = target_info.get("partial_exit_plan")
-        trailing_stop_plan = target_info.get("trailing_stop_plan")
-        exit_monitoring = target_info.get("exit_monitoring")
+        # NO-GO plans are discarded in backtests; only format the entry zone when it can be used
+        entry_zone = ""
+        if verbose or go_check.is_pass:
+            premium = trade.premium
+            entry_zone = f"${premium - 0.05:.2f} - ${premium + 0.05:.2f}"
 
-        return TradePlan(
-            trade=trade,
-            position=position,
-            entry_zone=f"${trade.premium - 0.05:.2f} - ${trade.premium + 0.05:.2f}",
-            stop_loss=stop_info['stop_loss'],
-            stop_risk_pct=stop_info['risk_pct'],
-            target_1=target_info['target_1'],
-            target_1_r=target_info['target_1_r'],
-            runner_activated=target_info['runner_activated'],
-            runner_contracts=target_info['runner_contracts'],
-            runner_target=target_info['runner_target'],
-            max_loss_dollars=stop_info['max_loss_dollars'],
-            max_gain_dollars=position.contracts * (target_info['target_1'] - trade.premium) * 100,
-            go_no_go=go_check['decision'],
-            go_no_go_reasons=go_check['reasons'],
-            technical_reasoning=technical_reasoning,
-            is_technical=is_technical,
-            partial_exit_plan=partial_exit_plan,
-            trailing_stop_plan=trailing_stop_plan,
-            exit_monitoring=exit_monitoring,
+        return position, stop_info, target_info, go_check, entry_zone
+
+
+    def create_trade_plans_batch(self, trades) -> TradePlanArray:
+        """
+        Vectorized rule-based plans for many trades at once (backtests, screeners).
+
+        Applies the same fixed sizing, stop, R-based/percentage target and go/no-go
+        rules as create_trade_plan without market context, but computes every
+        trade in one pass of NumPy array math. No TradePlan objects or exit plans
+        are built; callers index the returned arrays.
+
+        Args:
+            trades: Sequence of OptionTrade objects
+
+        Returns:
+            TradePlanArray of equal-length arrays named like the TradePlan fields
+            (contracts, stop_loss, target_1, ...) plus risk_percentage and is_pass.
+            Use .iter_rows(trades) where TradePlan objects are needed.
+        """
+        n = len(trades)
+        premiums = np.fromiter((t.premium for t in trades), dtype=np.float64, count=n)
+        is_ode = np.fromiter(
+            (bool(getattr(t, "is_ode", False)) for t in trades), dtype=np.bool_, count=n
         )
+        return self.plan_batch(premiums, is_ode)
+
+    def plan_batch(self, premiums, is_ode=None, dtype=np.float64) -> TradePlanArray:
+        """
+        Array entry point for batch planning when premiums are already columnar
+        (e.g. a backtest DataFrame), skipping trade objects entirely.
+
+        Batches of at least _GPU_BATCH_THRESHOLD rows run on the GPU when CuPy
+        and a CUDA device are available; results always come back as NumPy arrays.
+
+        Args:
+            premiums: Array-like of option premiums
+            is_ode: Array-like of same-day-expiration flags (default all False)
+            dtype: np.float64 (default) or np.float32. float32 halves memory
+                traffic on very large sweeps (contracts become int32); values
+                carry ~1e-7 relative error, so half-cent ties (e.g. a 50% stop
+                on an odd-cent premium) can round a cent the other way than
+                the scalar path, shifting the targets derived from that stop.
+
+        Returns:
+            TradePlanArray, as from create_trade_plans_batch
+        """
+        premiums = np.asarray(premiums, dtype=dtype)
+        if is_ode is None:
+            use_ode = np.zeros(premiums.shape, dtype=np.bool_)
+        else:
+            use_ode = np.asarray(is_ode, dtype=np.bool_) & self._ode_enabled
+
+        cp = _gpu_backend() if premiums.size >= _GPU_BATCH_THRESHOLD else None
+        if cp is None:
+            results = self._plan_kernel(premiums, use_ode, xp=np)
+        else:
+            results = self._plan_kernel(cp.asarray(premiums), cp.asarray(use_ode), xp=cp)
+            results = tuple(cp.asnumpy(a) for a in results)
+
+        return TradePlanArray(premiums, *results)
+
+    def plan_batch_parallel(self, premiums, is_ode=None, dtype=np.float64,
+                            workers: Optional[int] = None,
+                            chunk_size: int = 250_000) -> TradePlanArray:
+        """
+        plan_batch over chunks of rows on a thread pool (large parameter sweeps).
+
+        NumPy releases the GIL inside its array loops, so chunks run on separate
+        cores without copying arrays to worker processes. Inputs that fit in one
+        chunk go straight to plan_batch. Results are identical to plan_batch.
+        """
+        premiums = np.asarray(premiums, dtype=dtype)
+        if is_ode is not None:
+            is_ode = np.asarray(is_ode, dtype=np.bool_)
+        n = premiums.size
+        if n <= chunk_size:
+            return self.plan_batch(premiums, is_ode, dtype)
+
+        def run(start: int) -> TradePlanArray:
+            stop = start + chunk_size
+            return self.plan_batch(
+                premiums[start:stop], None if is_ode is None else is_ode[start:stop], dtype
+            )
 
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(run, range(0, n, chunk_size)))
+        return TradePlanArray(*(
+            np.concatenate([getattr(part, f.name) for part in parts]) for f in fields(TradePlanArray)
+        ))
 
 # CLI test
 if __name__ == "__main__":
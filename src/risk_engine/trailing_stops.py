@@ -3,12 +3,19 @@ Dynamic Trailing Stop Management
 Combines ATR-based stops with technical levels for optimal exit timing
 """
 
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, NamedTuple, Optional, List
+import numpy as np
 
+from risk_engine._rounding import round_half_even
 
-@dataclass
-class TrailingStopLevel:
+# Stop type codes used by the batch/array APIs (index into this tuple)
+STOP_TYPES = ('atr', 'technical', 'breakeven', 'initial')
+STOP_ATR, STOP_TECHNICAL, STOP_BREAKEVEN, STOP_INITIAL = range(4)
+_STOP_TYPE_CODES = {name: code for code, name in enumerate(STOP_TYPES)}
+
+
+class TrailingStopLevel(NamedTuple):
     """Represents a trailing stop level"""
     price: float
     type: str  # 'atr', 'technical', 'breakeven'
@@ -16,12 +23,28 @@ class TrailingStopLevel:
     priority: int  # Lower = higher priority
 
 
+class PreparedZones(NamedTuple):
+    """S/R zones pre-sorted for repeated trailing stop queries (see prepare_zones)"""
+    support_prices: List[float]  # ascending by (price, strength)
+    support_strengths: list
+    resistance_prices: List[float]  # ascending by (price, -strength)
+    resistance_strengths: list
+
+
 class TrailingStopManager:
     """
     Manages dynamic trailing stops that adjust based on price movement
     and technical levels.
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'config', 'atr_config', 'tech_config', 'breakeven_config',
+        '_atr_enabled', '_m_init', '_m_mid', '_m_high', '_atr_mults', '_atr_phases',
+        '_tech_enabled', '_min_distance', '_support_buffer', '_resistance_buffer',
+        '_r_trigger', '_debug',
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize trailing stop manager.
@@ -34,6 +57,22 @@ class TrailingStopManager:
         self.tech_config = self.config.get('technical_trailing', {})
         self.breakeven_config = self.config.get('breakeven', {})
 
+        # Resolve settings once (read on every tick)
+        self._atr_enabled = self.atr_config.get('enabled', True)
+        self._m_init = self.atr_config.get('initial_multiplier', 1.5)
+        self._m_mid = self.atr_config.get('mid_multiplier', 2.0)
+        self._m_high = self.atr_config.get('high_multiplier', 2.5)
+        # Multiplier and phase name by profit bucket (<2R, 2R+, 4R+)
+        self._atr_mults = (self._m_init, self._m_mid, self._m_high)
+        self._atr_phases = ('initial', 'mid profit', 'high profit')
+        self._tech_enabled = self.tech_config.get('enabled', True)
+        self._min_distance = self.tech_config.get('min_distance_from_entry', 0.5)
+        # Entry multipliers for the minimum technical-stop distance (CALL support / PUT resistance)
+        self._support_buffer = 1 + self._min_distance / 100
+        self._resistance_buffer = 1 - self._min_distance / 100
+        self._r_trigger = self.breakeven_config.get('r_trigger', 2.0)
+        self._debug = self.config.get('debug', False)
+
     def calculate_trailing_stop(
         self,
         entry_price: float,
@@ -55,29 +94,47 @@ class TrailingStopManager:
             atr: Average True Range
             profit_r: Current profit in R (risk units)
             option_type: 'CALL' or 'PUT'
-            sr_zones: Support/resistance analysis
+            sr_zones: Support/resistance analysis, or PreparedZones from prepare_zones
             market_context: Additional market context
 
         Returns:
             Dict with trailing stop price, type, and reasoning
         """
-        candidates = []
+        # Fast path (most ticks): no S/R zones and below the breakeven trigger,
+        # so the ATR stop is the only possible candidate
+        if not (sr_zones and self._tech_enabled) and not profit_r >= self._r_trigger and not self._debug:
+            if atr and self._atr_enabled:
+                bucket = (profit_r >= 2.0) + (profit_r >= 4.0)
+                mult = self._atr_mults[bucket]
+                if option_type == 'CALL':
+                    atr_stop = entry_price + (current_price - entry_price) - (mult * atr)
+                    tighter = not atr_stop <= initial_stop
+                    final_price = max(atr_stop, initial_stop)
+                else:
+                    atr_stop = entry_price - (entry_price - current_price) + (mult * atr)
+                    tighter = not atr_stop >= initial_stop
+                    final_price = min(atr_stop, initial_stop)
+                if tighter:
+                    return {
+                        'trailing_stop': round(final_price, 2),
+                        'type': 'atr',
+                        'reason': f"ATR trailing ({self._atr_phases[bucket]}): {mult}x ATR below peak",
+                        'active': True,
+                        'profit_r': profit_r,
+                        'all_candidates': ()
+                    }
+            return {
+                'trailing_stop': initial_stop,
+                'type': 'initial',
+                'reason': 'Using initial stop loss',
+                'active': False
+            }
 
-        # 1. ATR-Based Trailing Stop
-        if atr and self.atr_config.get('enabled', True):
-            atr_stop = self._calculate_atr_trailing(
-                entry_price,
-                current_price,
-                initial_stop,
-                atr,
-                profit_r,
-                option_type
-            )
-            if atr_stop:
-                candidates.append(atr_stop)
+        # Candidates are collected in priority order (technical, ATR, breakeven)
+        candidates = []
 
-        # 2. Technical Level Trailing Stop
-        if sr_zones and self.tech_config.get('enabled', True):
+        # 1. Technical Level Trailing Stop
+        if sr_zones and self._tech_enabled:
             tech_stop = self._calculate_technical_trailing(
                 entry_price,
                 current_price,
@@ -89,8 +146,21 @@ class TrailingStopManager:
             if tech_stop:
                 candidates.append(tech_stop)
 
+        # 2. ATR-Based Trailing Stop
+        if atr and self._atr_enabled:
+            atr_stop = self._calculate_atr_trailing(
+                entry_price,
+                current_price,
+                initial_stop,
+                atr,
+                profit_r,
+                option_type
+            )
+            if atr_stop:
+                candidates.append(atr_stop)
+
         # 3. Breakeven Stop (at R trigger points)
-        if profit_r >= self.breakeven_config.get('r_trigger', 2.0):
+        if profit_r >= self._r_trigger:
             breakeven_stop = self._calculate_breakeven_stop(
                 entry_price,
                 current_price,
@@ -109,8 +179,7 @@ class TrailingStopManager:
                 'active': False
             }
 
-        # Sort by priority and select best
-        candidates.sort(key=lambda x: x.priority)
+        # Highest-priority candidate comes first
         best_stop = candidates[0]
 
         # Ensure stop never goes below initial stop (risk reduction only)
@@ -123,12 +192,166 @@ class TrailingStopManager:
             'reason': best_stop.reason,
             'active': True,
             'profit_r': profit_r,
+            # Every candidate considered; only collected with trailing_stops.debug
             'all_candidates': [
                 {'price': c.price, 'type': c.type, 'reason': c.reason}
                 for c in candidates
-            ]
+            ] if self._debug else ()
         }
 
+    def calculate_trailing_stop_into(
+        self,
+        out_stop: np.ndarray,
+        out_type: np.ndarray,
+        out_active: np.ndarray,
+        idx: int,
+        entry_price: float,
+        current_price: float,
+        initial_stop: float,
+        atr: Optional[float],
+        profit_r: float,
+        option_type: str,
+        sr_zones=None,
+        market_context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Same stop as calculate_trailing_stop, written into row idx of
+        preallocated arrays instead of returned as a dict (portfolio loops
+        storing results by column).
+
+        Args:
+            out_stop: Float array receiving the trailing stop price
+            out_type: Integer array receiving the type code (index into STOP_TYPES)
+            out_active: Bool array receiving the active flag
+            idx: Row to write
+            (remaining arguments as for calculate_trailing_stop)
+        """
+        # First candidate in priority order wins; lower-priority ones are not computed
+        level = None
+        if sr_zones and self._tech_enabled:
+            level = self._calculate_technical_trailing(
+                entry_price, current_price, initial_stop, sr_zones, option_type, market_context
+            )
+        if level is None and atr and self._atr_enabled:
+            level = self._calculate_atr_trailing(
+                entry_price, current_price, initial_stop, atr, profit_r, option_type
+            )
+        if level is None and profit_r >= self._r_trigger:
+            level = self._calculate_breakeven_stop(entry_price, current_price, profit_r, option_type)
+
+        if level is None:
+            out_stop[idx] = initial_stop
+            out_type[idx] = STOP_INITIAL
+            out_active[idx] = False
+            return
+
+        final_price = max(level.price, initial_stop) if option_type == 'CALL' else \
+                      min(level.price, initial_stop)
+        out_stop[idx] = round(final_price, 2)
+        out_type[idx] = _STOP_TYPE_CODES[level.type]
+        out_active[idx] = True
+
+    def calculate_trailing_stop_batch(
+        self,
+        entry_price,
+        current_price,
+        initial_stop,
+        atr,
+        profit_r,
+        is_call
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_trailing_stop for many positions at once
+        (portfolio monitoring, backtests).
+
+        Applies the ATR and breakeven rules with the same priority and
+        clamping as the scalar method. Technical (S/R) levels are per-position
+        data and are not covered; use calculate_trailing_stop for positions
+        with S/R zones.
+
+        Args:
+            entry_price, current_price, initial_stop, atr, profit_r:
+                Array-likes of equal length (atr 0 = no ATR)
+            is_call: Array-like of bools (True for CALL, False for PUT)
+
+        Returns:
+            Dict of arrays: 'trailing_stop', 'type' (codes into STOP_TYPES), 'active'
+        """
+        entry = np.asarray(entry_price, dtype=np.float64)
+        current = np.asarray(current_price, dtype=np.float64)
+        initial = np.asarray(initial_stop, dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+        profit_r = np.asarray(profit_r, dtype=np.float64)
+        is_call = np.asarray(is_call, dtype=np.bool_)
+
+        # 1. ATR-based stop (multiplier tightens with profit)
+        mult = np.take(self._atr_mults, (profit_r >= 2.0).astype(np.intp) + (profit_r >= 4.0))
+        atr_stop = np.where(
+            is_call,
+            entry + (current - entry) - (mult * atr),
+            entry - (entry - current) + (mult * atr),
+        )
+        use_atr = (atr != 0) & np.where(is_call, ~(atr_stop <= initial), ~(atr_stop >= initial))
+        if not self._atr_enabled:
+            use_atr[:] = False
+
+        # 3. Breakeven stop (entry price) at the R trigger
+        use_breakeven = profit_r >= self._r_trigger
+
+        # ATR outranks breakeven; the stop never loosens past the initial stop
+        active = use_atr | use_breakeven
+        best = np.where(use_atr, atr_stop, np.where(use_breakeven, entry, initial))
+        clamped = np.where(is_call, np.maximum(best, initial), np.minimum(best, initial))
+        stop_type = np.where(use_atr, STOP_ATR, np.where(use_breakeven, STOP_BREAKEVEN, STOP_INITIAL))
+
+        return {
+            'trailing_stop': np.where(active, round_half_even(clamped, 2), initial),
+            'type': stop_type.astype(np.int8),
+            'active': active,
+        }
+
+    def atr_trailing_series(
+        self,
+        entry_price: float,
+        prices,
+        atr,
+        initial_stop: float,
+        option_type: str
+    ) -> np.ndarray:
+        """
+        ATR trailing stop for every bar of one position, in one pass (backtests).
+
+        Each bar gets the same ATR stop as calculate_trailing_stop (multiplier
+        by the bar's profit in R), then the stop is ratcheted: it only
+        tightens, never past the initial stop. NaN ATR bars (indicator warm-up)
+        carry the previous stop forward.
+
+        Args:
+            entry_price: Entry premium price
+            prices: Array-like of premium prices per bar
+            atr: Array-like of ATR values per bar
+            initial_stop: Initial stop loss price
+            option_type: 'CALL' or 'PUT'
+
+        Returns:
+            Array of trailing stop levels, one per bar (unrounded)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        atr = np.asarray(atr, dtype=np.float64)
+        risk = abs(entry_price - initial_stop)
+        is_call = option_type == 'CALL'
+
+        profit = prices - entry_price if is_call else entry_price - prices
+        profit_r = profit / risk if risk > 0 else np.zeros_like(prices)
+        mult = np.take(self._atr_mults, (profit_r >= 2.0).astype(np.intp) + (profit_r >= 4.0))
+
+        # fmax/fmin skip NaN, so warm-up bars keep the last valid stop
+        if is_call:
+            raw = entry_price + profit - (mult * atr)
+            return np.fmax.accumulate(np.fmax(raw, initial_stop))
+        raw = entry_price - profit + (mult * atr)
+        return np.fmin.accumulate(np.fmin(raw, initial_stop))
+
     def _calculate_atr_trailing(
         self,
         entry_price: float,
@@ -140,15 +363,9 @@ class TrailingStopManager:
     ) -> Optional[TrailingStopLevel]:
         """Calculate ATR-based trailing stop that tightens with profit."""
         # Use different multipliers based on profit level
-        if profit_r >= 4.0:
-            mult = self.atr_config.get('high_multiplier', 2.5)
-            phase = 'high profit'
-        elif profit_r >= 2.0:
-            mult = self.atr_config.get('mid_multiplier', 2.0)
-            phase = 'mid profit'
-        else:
-            mult = self.atr_config.get('initial_multiplier', 1.5)
-            phase = 'initial'
+        bucket = (profit_r >= 2.0) + (profit_r >= 4.0)
+        mult = self._atr_mults[bucket]
+        phase = self._atr_phases[bucket]
 
         # Trail at entry + profit - (ATR * multiplier)
         if option_type == 'CALL':
@@ -173,61 +390,113 @@ class TrailingStopManager:
             priority=2
         )
 
+    def prepare_zones(self, sr_zones: Dict[str, Any]) -> PreparedZones:
+        """
+        Sort S/R zones once for many calculate_trailing_stop calls against the
+        same zones (e.g. every tick within a bar). Pass the result as sr_zones;
+        each technical-level lookup then bisects instead of scanning every zone.
+
+        Args:
+            sr_zones: Support/resistance analysis
+
+        Returns:
+            PreparedZones with parallel price/strength lists
+        """
+        supports = sorted(
+            (z.get('price', 0), z.get('strength', 0)) for z in sr_zones.get('support_zones', [])
+        )
+        resistances = sorted(
+            ((z.get('price', 0), z.get('strength', 0)) for z in sr_zones.get('resistance_zones', [])),
+            key=lambda z: (z[0], -z[1])
+        )
+        return PreparedZones(
+            support_prices=[price for price, _ in supports],
+            support_strengths=[strength for _, strength in supports],
+            resistance_prices=[price for price, _ in resistances],
+            resistance_strengths=[strength for _, strength in resistances],
+        )
+
     def _calculate_technical_trailing(
         self,
         entry_price: float,
         current_price: float,
         initial_stop: float,
-        sr_zones: Dict[str, Any],
+        sr_zones,
         option_type: str,
         market_context: Optional[Dict[str, Any]] = None
     ) -> Optional[TrailingStopLevel]:
         """Trail to highest support above breakeven."""
-        min_distance = self.tech_config.get('min_distance_from_entry', 0.5)
+        if isinstance(sr_zones, PreparedZones):
+            if option_type == 'CALL':
+                # Highest support strictly between the breakeven buffer and the current price
+                prices = sr_zones.support_prices
+                lo = bisect_right(prices, entry_price * self._support_buffer)
+                hi = bisect_left(prices, current_price)
+                if hi <= lo:
+                    return None
+                stop_price = prices[hi - 1]
+                return TrailingStopLevel(
+                    price=stop_price,
+                    type='technical',
+                    reason=f"Technical support at ${stop_price:.2f} (strength: {sr_zones.support_strengths[hi - 1]})",
+                    priority=1
+                )
+            # Lowest resistance strictly between the current price and the breakeven buffer
+            prices = sr_zones.resistance_prices
+            lo = bisect_right(prices, current_price)
+            hi = bisect_left(prices, entry_price * self._resistance_buffer)
+            if hi <= lo:
+                return None
+            stop_price = prices[lo]
+            return TrailingStopLevel(
+                price=stop_price,
+                type='technical',
+                reason=f"Technical resistance at ${stop_price:.2f} (strength: {sr_zones.resistance_strengths[lo]})",
+                priority=1
+            )
 
         key_levels = sr_zones.get('key_levels', {})
 
         if option_type == 'CALL':
             # Look for highest support above breakeven
             support_zones = sr_zones.get('support_zones', [])
+            min_price = entry_price * self._support_buffer
             valid_supports = [
-                z for z in support_zones
-                if z.get('price', 0) > entry_price * (1 + min_distance / 100)
-                and z.get('price', 0) < current_price
+                (z.get('price', 0), z.get('strength', 0)) for z in support_zones
+                if min_price < z.get('price', 0) < current_price
             ]
 
             if not valid_supports:
                 return None
 
-            # Use highest support with best strength
-            best_support = max(valid_supports, key=lambda z: (z.get('price', 0), z.get('strength', 0)))
-            stop_price = best_support.get('price', 0)
+            # Use highest support with best strength ((price, strength) tuples compare in that order)
+            stop_price, strength = max(valid_supports)
 
             return TrailingStopLevel(
                 price=stop_price,
                 type='technical',
-                reason=f"Technical support at ${stop_price:.2f} (strength: {best_support.get('strength', 0)})",
+                reason=f"Technical support at ${stop_price:.2f} (strength: {strength})",
                 priority=1  # Higher priority than ATR
             )
         else:
             # For PUTs, look for lowest resistance below entry
             resistance_zones = sr_zones.get('resistance_zones', [])
+            max_price = entry_price * self._resistance_buffer
             valid_resistances = [
-                z for z in resistance_zones
-                if z.get('price', 0) < entry_price * (1 - min_distance / 100)
-                and z.get('price', 0) > current_price
+                (z.get('price', 0), -z.get('strength', 0)) for z in resistance_zones
+                if current_price < z.get('price', 0) < max_price
             ]
 
             if not valid_resistances:
                 return None
 
-            best_resistance = min(valid_resistances, key=lambda z: (z.get('price', float('inf')), -z.get('strength', 0)))
-            stop_price = best_resistance.get('price', 0)
+            # Lowest resistance, strongest first on ties (strength is stored negated)
+            stop_price, neg_strength = min(valid_resistances)
 
             return TrailingStopLevel(
                 price=stop_price,
                 type='technical',
-                reason=f"Technical resistance at ${stop_price:.2f} (strength: {best_resistance.get('strength', 0)})",
+                reason=f"Technical resistance at ${stop_price:.2f} (strength: {-neg_strength})",
                 priority=1
             )
 
@@ -239,7 +508,7 @@ class TrailingStopManager:
         option_type: str
     ) -> Optional[TrailingStopLevel]:
         """Move stop to breakeven at configured R threshold."""
-        r_trigger = self.breakeven_config.get('r_trigger', 2.0)
+        r_trigger = self._r_trigger
 
         if profit_r < r_trigger:
             return None
@@ -274,6 +543,22 @@ class TrailingStopManager:
         else:
             return current_price >= trailing_stop
 
+    def should_exit_batch(self, current_prices, trailing_stops, is_call) -> np.ndarray:
+        """
+        Vectorized should_exit for many open positions.
+
+        Args:
+            current_prices: Array-like of current premium prices
+            trailing_stops: Array-like of trailing stop levels
+            is_call: Array-like of bools (True for CALL, False for PUT)
+
+        Returns:
+            Bool array, True where the stop was hit
+        """
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+        trailing_stops = np.asarray(trailing_stops, dtype=np.float64)
+        return np.where(is_call, current_prices <= trailing_stops, current_prices >= trailing_stops)
+
 
 # Example usage
 if __name__ == "__main__":
@@ -9,16 +9,40 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 import yfinance as yf
 import pandas as pd
+import random
 import time
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Any, Optional
 
+from src.analysis.indicators import latest_atr
 from src.analysis.price_action import calculate_support_resistance_zones
+from src.analysis.greeks import (
+    solve_iv_black_scholes,
+    black_scholes_call_price,
+    black_scholes_put_price
+)
 from src.analysis.exit_patterns import (
     detect_resistance_breakout,
     detect_resistance_rejection,
     get_next_resistance_level
 )
+from src.utils.cache import get_cache, set_cache
+
+# 5 sessions of 5m bars - same window the original full 5d download held
+INTRADAY_WINDOW = 5 * 78
+
+# Same rate main.py uses for its Black-Scholes scenarios
+RISK_FREE_RATE = 0.05
+
+# Alert detectors only fire within 0.5% of the first S/R level; skip them
+# entirely while the last bar is more than this far away
+LEVEL_GATE_PCT = 0.01
+
+# Restarting a monitor within this window reuses the day's S/R zones
+SR_CACHE_TTL = 3600
+
+# First retry delay (seconds) after a failed poll; doubles up to poll_interval
+RETRY_BACKOFF_START = 5
 
 
 class LiveTradeMonitor:
@@ -71,11 +95,25 @@ class LiveTradeMonitor:
 
         # State tracking
         self.entry_time = datetime.now()
+        self._entry_monotonic = time.monotonic()
         self.position_open = True
         self.contracts_remaining = contracts
-        self.alerts_sent = []
+        self.alerts_sent = set()
         self.highest_premium = entry_premium
         self.trailing_stop = self.stop_loss_premium
+        self._last_premium: Optional[float] = None
+        self._intraday_df: Optional[pd.DataFrame] = None
+        self._backoff = RETRY_BACKOFF_START
+
+        # IV implied from the entry fill - None falls back to the delta heuristic
+        self.implied_vol = solve_iv_black_scholes(
+            spot=entry_underlying,
+            strike=strike,
+            time_years=dte / 365.0,
+            risk_free_rate=RISK_FREE_RATE,
+            option_type=self.option_type,
+            market_price=entry_premium
+        ) if dte > 0 else None
 
         # Fetch initial S/R zones
         print(f"\n{'='*80}")
@@ -96,36 +134,42 @@ class LiveTradeMonitor:
         print(f"Polling every {self.poll_interval//60} minutes\n")
         print(f"{'='*80}\n")
 
+    @staticmethod
+    def _normalize_cols(df: pd.DataFrame) -> pd.DataFrame:
+        """Flatten yfinance's (field, ticker) columns and lowercase them."""
+        columns = df.columns
+        if isinstance(columns, pd.MultiIndex):
+            columns = columns.get_level_values(0)
+        df.columns = columns.astype(str).str.lower()
+        return df
+
     def _update_sr_zones(self):
         """Update support/resistance zones."""
         try:
-            df = yf.download(self.ticker, period="3mo", interval="1d", progress=False)
-
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = [col[0].lower() for col in df.columns]
+            cache_key = f"live_monitor_sr:{self.ticker}:{date.today().isoformat()}"
+            cached = get_cache(cache_key)
+            if cached is not None:
+                self.sr_zones = cached['sr_zones']
+                current_price = cached['current_price']
+                atr = cached['atr']
             else:
-                df.columns = [str(col).lower() for col in df.columns]
-
-            # Calculate ATR
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift())
-            low_close = abs(df['low'] - df['close'].shift())
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr = true_range.rolling(14).mean().iloc[-1]
-
-            # Calculate zones
-            current_price = df['close'].iloc[-1]
-            self.sr_zones = calculate_support_resistance_zones(
-                df=df,
-                current_price=current_price,
-                ticker=self.ticker,
-                lookback_days=60,
-                atr=atr,
-                max_levels=5
-            )
+                self.sr_zones, current_price, atr = self._compute_sr_zones()
+                # Only price/strength are read back - keep the entry small
+                set_cache(cache_key, {
+                    'sr_zones': {
+                        side: [
+                            {'price': float(z['price']), 'strength': float(z['strength'])}
+                            for z in self.sr_zones.get(side, [])
+                        ]
+                        for side in ('resistance_zones', 'support_zones')
+                    },
+                    'current_price': float(current_price),
+                    'atr': float(atr)
+                }, ttl=SR_CACHE_TTL)
 
             self.current_underlying = current_price
             self.atr = atr
+            self._cache_level_triggers()
 
             # Display key levels
             if self.option_type == 'CALL':
@@ -150,12 +194,89 @@ class LiveTradeMonitor:
             self.sr_zones = {'resistance_zones': [], 'support_zones': []}
             self.current_underlying = self.entry_underlying
             self.atr = 0
+            self._cache_level_triggers()
+
+    def _compute_sr_zones(self):
+        """Download daily bars and build S/R zones; returns (zones, last close, ATR)."""
+        df = yf.download(self.ticker, period="3mo", interval="1d", progress=False)
+
+        df = self._normalize_cols(df)
+
+        # Calculate ATR
+        atr = latest_atr(
+            df['high'].to_numpy(dtype=float),
+            df['low'].to_numpy(dtype=float),
+            df['close'].to_numpy(dtype=float),
+            period=14
+        )
+
+        # Calculate zones
+        current_price = df['close'].iat[-1]
+        sr_zones = calculate_support_resistance_zones(
+            df=df,
+            current_price=current_price,
+            ticker=self.ticker,
+            lookback_days=60,
+            atr=atr,
+            max_levels=5
+        )
+        return sr_zones, current_price, atr
+
+    def _cache_level_triggers(self):
+        """Cache the prices the first resistance/support must be near for alerts."""
+        resistance_zones = self.sr_zones.get('resistance_zones', [])
+        support_zones = self.sr_zones.get('support_zones', [])
+        self._r_trigger = resistance_zones[0]['price'] * (1 - LEVEL_GATE_PCT) if resistance_zones else None
+        self._s_trigger = support_zones[0]['price'] * (1 + LEVEL_GATE_PCT) if support_zones else None
+
+    def _fetch_intraday(self) -> pd.DataFrame:
+        """
+        Fetch 5m bars for the monitored ticker.
+
+        The first call downloads the full 5-day window; later calls only
+        request bars since the last one held and append them, so each poll
+        parses a handful of rows instead of ~390.
+        """
+        if self._intraday_df is None or self._intraday_df.empty:
+            df = yf.download(self.ticker, period="5d", interval="5m", progress=False)
+        else:
+            df = yf.download(
+                self.ticker,
+                start=self._intraday_df.index[-1],
+                interval="5m",
+                progress=False
+            )
+
+        df = self._normalize_cols(df)
+
+        if self._intraday_df is not None and not self._intraday_df.empty:
+            if df.empty:
+                return self._intraday_df
+            # The last held bar may still have been forming - keep the fresh copy
+            df = pd.concat([self._intraday_df, df])
+            df = df[~df.index.duplicated(keep='last')].iloc[-INTRADAY_WINDOW:]
+
+        self._intraday_df = df
+        return df
 
     def _estimate_current_premium(self, current_underlying: float) -> float:
         """
-        Rough estimate of current option premium based on underlying move.
-        Simplified - uses delta approximation.
+        Estimate current option premium from the underlying price.
+
+        Reprices with Black-Scholes at the IV implied from the entry fill,
+        decaying time to expiry by the time spent in the position. Falls back
+        to a rough delta approximation when IV could not be solved.
         """
+        if self.implied_vol is not None:
+            elapsed_days = (datetime.now() - self.entry_time).total_seconds() / 86400
+            time_years = max(self.dte - elapsed_days, 0.0) / 365.0
+            price_fn = black_scholes_call_price if self.option_type == 'CALL' else black_scholes_put_price
+            estimated_premium = price_fn(
+                current_underlying, self.strike, time_years, RISK_FREE_RATE, self.implied_vol
+            )
+            # Floor at $0.01
+            return max(0.01, float(estimated_premium))
+
         underlying_move_pct = (current_underlying - self.entry_underlying) / self.entry_underlying
 
         # Rough delta approximation
@@ -195,6 +316,13 @@ class LiveTradeMonitor:
         """
         alerts = []
 
+        # Quiet period: last bar nowhere near the level, no detector can fire
+        if self.option_type == 'CALL':
+            if self._r_trigger is None or max(df['high'].iat[-1], self.current_underlying) < self._r_trigger:
+                return alerts
+        elif self._s_trigger is None or self.current_underlying > self._s_trigger:
+            return alerts
+
         if self.option_type == 'CALL':
             resistance_zones = self.sr_zones.get('resistance_zones', [])
             if not resistance_zones:
@@ -205,8 +333,9 @@ class LiveTradeMonitor:
             resistance_level = first_resistance['price']
             resistance_strength = first_resistance['strength']
 
-            # Get recent bars (last 20 for breakout detection)
-            recent_bars = df.tail(20)
+            # Get recent bars (last 20 for breakout, last 3 for rejection)
+            recent_bars = df.iloc[-20:]
+            last_bars = df.iloc[-3:]
 
             # Check breakout
             breakout = detect_resistance_breakout(
@@ -237,7 +366,7 @@ class LiveTradeMonitor:
 
             # Check rejection (last 3 bars)
             rejection = detect_resistance_rejection(
-                df=recent_bars.tail(3),
+                df=last_bars,
                 resistance_level=resistance_level,
                 option_type=self.option_type
             )
@@ -265,7 +394,7 @@ class LiveTradeMonitor:
             first_support = support_zones[0]
             support_level = first_support['price']
 
-            recent_bars = df.tail(20)
+            last_bars = df.iloc[-3:]
 
             # Check breakdown (inverse of breakout)
             if self.current_underlying < support_level * 0.995:
@@ -282,7 +411,7 @@ class LiveTradeMonitor:
 
             # Check rejection at support (bullish reversal)
             rejection = detect_resistance_rejection(
-                df=recent_bars.tail(3),
+                df=last_bars,
                 resistance_level=support_level,
                 option_type=self.option_type
             )
@@ -304,57 +433,74 @@ class LiveTradeMonitor:
         return alerts
 
     def _print_alert(self, alert: Dict[str, Any]):
-        """Print alert with formatting."""
-        print(f"\n{'!'*80}")
-        print(f"  [!] {alert['type']} ALERT - {alert['urgency']} URGENCY")
-        print(f"{'!'*80}\n")
+        """Print alert with formatting (one write per alert)."""
+        lines = [
+            f"\n{'!'*80}",
+            f"  [!] {alert['type']} ALERT - {alert['urgency']} URGENCY",
+            f"{'!'*80}\n",
+        ]
 
         if alert['action'] == 'HOLD_RUNNER':
-            print(f"[+] BREAKOUT CONFIRMED at ${alert['level']:.2f}!")
-            print(f"\n    ACTION: HOLD ALL {self.contracts_remaining} CONTRACTS")
-            print(f"    → Trail stop to ${alert['new_stop']:.2f}")
+            lines.append(f"[+] BREAKOUT CONFIRMED at ${alert['level']:.2f}!")
+            lines.append(f"\n    ACTION: HOLD ALL {self.contracts_remaining} CONTRACTS")
+            lines.append(f"    → Trail stop to ${alert['new_stop']:.2f}")
             if alert.get('next_target'):
-                print(f"    → New target: ${alert['next_target']:.2f}")
-            print(f"\n    Reason: {alert['reason']}")
+                lines.append(f"    → New target: ${alert['next_target']:.2f}")
+            lines.append(f"\n    Reason: {alert['reason']}")
 
         elif alert['action'] == 'EXIT_PARTIAL':
-            print(f"[-] REJECTION DETECTED at current level!")
-            print(f"    Pattern: {alert['pattern']}")
-            print(f"\n    ACTION: EXIT {alert['exit_contracts']} CONTRACTS ({alert['exit_pct']:.0%})")
-            print(f"    → Keep {self.contracts_remaining - alert['exit_contracts']} with tight stop")
-            print(f"\n    Reason: {alert['reason']}")
+            lines.append(f"[-] REJECTION DETECTED at current level!")
+            lines.append(f"    Pattern: {alert['pattern']}")
+            lines.append(f"\n    ACTION: EXIT {alert['exit_contracts']} CONTRACTS ({alert['exit_pct']:.0%})")
+            lines.append(f"    → Keep {self.contracts_remaining - alert['exit_contracts']} with tight stop")
+            lines.append(f"\n    Reason: {alert['reason']}")
 
-        print(f"\n{'!'*80}\n")
+        lines.append(f"\n{'!'*80}\n")
+        print("\n".join(lines))
 
     def _print_status(self, estimated_premium: float):
-        """Print current position status."""
+        """Print current position status (one write per poll)."""
         # Calculate P/L
         pnl_per_contract = (estimated_premium - self.entry_premium) * 100
         total_pnl = pnl_per_contract * self.contracts_remaining
         pnl_pct = (estimated_premium - self.entry_premium) / self.entry_premium * 100
         r_multiple = (estimated_premium - self.entry_premium) / self.risk_per_contract if self.risk_per_contract > 0 else 0
 
-        # Time elapsed
-        elapsed = datetime.now() - self.entry_time
-        elapsed_str = f"{elapsed.seconds // 3600}h {(elapsed.seconds % 3600) // 60}m"
-
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Status Update")
-        print(f"{'-'*80}")
-        print(f"  Underlying: ${self.current_underlying:.2f} (Entry: ${self.entry_underlying:.2f})")
-        print(f"  Est Premium: ${estimated_premium:.2f} (Entry: ${self.entry_premium:.2f})")
-        print(f"  P/L: ${total_pnl:+.0f} ({pnl_pct:+.1f}%) | {r_multiple:+.2f}R")
-        print(f"  Contracts: {self.contracts_remaining} open")
-        print(f"  Stop: ${self.trailing_stop:.2f}")
-        print(f"  Time: {elapsed_str} in position")
-        print(f"{'-'*80}\n")
+        # Time elapsed (monotonic - immune to wall-clock adjustments)
+        hours, rem = divmod(int(time.monotonic() - self._entry_monotonic), 3600)
+        elapsed_str = f"{hours}h {rem // 60}m"
+
+        lines = [
+            f"[{datetime.now().strftime('%H:%M:%S')}] Status Update",
+            f"{'-'*80}",
+            f"  Underlying: ${self.current_underlying:.2f} (Entry: ${self.entry_underlying:.2f})",
+            f"  Est Premium: ${estimated_premium:.2f} (Entry: ${self.entry_premium:.2f})",
+            f"  P/L: ${total_pnl:+.0f} ({pnl_pct:+.1f}%) | {r_multiple:+.2f}R",
+            f"  Contracts: {self.contracts_remaining} open",
+            f"  Stop: ${self.trailing_stop:.2f}",
+            f"  Time: {elapsed_str} in position",
+            f"{'-'*80}\n",
+        ]
 
         # Check stop hit
         if estimated_premium <= self.trailing_stop:
-            print(f"\n[!] STOP HIT at ${estimated_premium:.2f} (Stop: ${self.trailing_stop:.2f})")
-            print(f"    EXIT ALL {self.contracts_remaining} CONTRACTS")
-            print(f"    Loss: ${total_pnl:.0f} ({pnl_pct:.1f}%)\n")
+            lines.append(f"\n[!] STOP HIT at ${estimated_premium:.2f} (Stop: ${self.trailing_stop:.2f})")
+            lines.append(f"    EXIT ALL {self.contracts_remaining} CONTRACTS")
+            lines.append(f"    Loss: ${total_pnl:.0f} ({pnl_pct:.1f}%)\n")
             self.position_open = False
 
+        print("\n".join(lines))
+
+    def _backoff_sleep(self):
+        """
+        Wait before retrying a failed poll.
+
+        Exponential backoff with jitter, capped at poll_interval, so a
+        transient outage recovers in seconds rather than a full interval.
+        """
+        time.sleep(min(self._backoff + random.random(), self.poll_interval))
+        self._backoff = min(self._backoff * 2, self.poll_interval)
+
     def monitor(self):
         """
         Main monitoring loop.
@@ -364,31 +510,23 @@ class LiveTradeMonitor:
             while self.position_open:
                 try:
                     # Fetch latest data
-                    df = yf.download(
-                        self.ticker,
-                        period="5d",
-                        interval="5m",
-                        progress=False
-                    )
-
-                    if isinstance(df.columns, pd.MultiIndex):
-                        df.columns = [col[0].lower() for col in df.columns]
-                    else:
-                        df.columns = [str(col).lower() for col in df.columns]
+                    df = self._fetch_intraday()
 
                     if df.empty:
                         print(f"[{datetime.now().strftime('%H:%M:%S')}] Warning: No data fetched, retrying...")
-                        time.sleep(self.poll_interval)
+                        self._backoff_sleep()
                         continue
+                    self._backoff = RETRY_BACKOFF_START
 
                     # Update current price
-                    self.current_underlying = df['close'].iloc[-1]
+                    self.current_underlying = df['close'].iat[-1]
 
                     # Estimate option premium
                     estimated_premium = self._estimate_current_premium(self.current_underlying)
+                    self._last_premium = estimated_premium
 
-                    # Update highest premium for trailing
-                    if estimated_premium > self.highest_premium:
+                    # Update highest premium for trailing - ignore sub-penny jitter
+                    if estimated_premium > self.highest_premium + 0.01:
                         self.highest_premium = estimated_premium
                         # Trail stop to 50% of profit
                         profit_from_entry = estimated_premium - self.entry_premium
@@ -405,7 +543,7 @@ class LiveTradeMonitor:
                         alert_key = f"{alert['type']}_{alert.get('level', 'N/A')}"
                         if alert_key not in self.alerts_sent:
                             self._print_alert(alert)
-                            self.alerts_sent.append(alert_key)
+                            self.alerts_sent.add(alert_key)
 
                             # Update state based on alert
                             if alert['action'] == 'EXIT_PARTIAL':
@@ -428,15 +566,17 @@ class LiveTradeMonitor:
                     raise
                 except Exception as e:
                     print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {e}")
-                    time.sleep(self.poll_interval)
+                    self._backoff_sleep()
 
         except KeyboardInterrupt:
             print(f"\n\n{'='*80}")
             print(f"  MONITORING STOPPED BY USER")
             print(f"{'='*80}\n")
 
-            # Final summary
-            estimated_premium = self._estimate_current_premium(self.current_underlying)
+            # Final summary - reuse the last status estimate so the two match
+            estimated_premium = self._last_premium
+            if estimated_premium is None:
+                estimated_premium = self._estimate_current_premium(self.current_underlying)
             total_pnl = (estimated_premium - self.entry_premium) * 100 * self.contracts_remaining
             r_multiple = (estimated_premium - self.entry_premium) / self.risk_per_contract if self.risk_per_contract > 0 else 0
 
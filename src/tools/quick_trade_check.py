@@ -3,18 +3,60 @@ Quick Trade Check - Pre-Trade Go/No-Go Filter
 Fast analysis: Should I take this trade right now?
 """
 
+import copy
 import sys
 import os
+import threading
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-import yfinance as yf
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
+from src.analysis.indicators import latest_atr
 from src.analysis.price_action import calculate_support_resistance_zones
 from src.analysis.trend_analysis import identify_trend, calculate_adx
 from src.analysis.volume_analysis import calculate_vwap
+from src.utils.ohlcv import get_ohlcv, get_ohlcv_batch
+
+# Repeat checks within this window reuse the last daily download
+OHLCV_CACHE_TTL = 900
+
+# Most confidence the S/R (support below) and trend checks can add
+MAX_DEFERRED_BONUS = {'CALL': 25, 'PUT': 15}
+
+# S/R zones per (ticker, last bar, price, ATR) - strike/premium don't affect them.
+# Entries are stored and handed out as copies, since callers get them in their result.
+SR_MEMO_SIZE = 32
+_sr_memo: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_sr_memo_lock = threading.Lock()
+
+
+def _sr_zones_memo(df: pd.DataFrame, ticker: str, current_price: float, atr: float) -> Dict[str, Any]:
+    """calculate_support_resistance_zones, reused across checks on the same bar."""
+    key = (ticker, df.index[-1].value, len(df), round(float(current_price), 4), round(float(atr), 4))
+    with _sr_memo_lock:
+        zones = _sr_memo.get(key)
+        if zones is not None:
+            _sr_memo.move_to_end(key)
+    if zones is not None:
+        return copy.deepcopy(zones)
+
+    zones = calculate_support_resistance_zones(
+        df=df,
+        current_price=current_price,
+        ticker=ticker,
+        lookback_days=60,
+        atr=atr,
+        max_levels=5
+    )
+    with _sr_memo_lock:
+        _sr_memo[key] = copy.deepcopy(zones)
+        if len(_sr_memo) > SR_MEMO_SIZE:
+            _sr_memo.popitem(last=False)
+    return zones
 
 
 def quick_check(
@@ -24,7 +66,9 @@ def quick_check(
     premium: float,
     underlying_price: Optional[float] = None,
     dte: int = 7,
-    iv: Optional[float] = None
+    iv: Optional[float] = None,
+    df: Optional[pd.DataFrame] = None,
+    verbose: bool = True
 ) -> Dict[str, Any]:
     """
     Quick pre-trade analysis - Should you take this trade?
@@ -37,24 +81,22 @@ def quick_check(
         underlying_price: Current stock price (fetched if None)
         dte: Days to expiration (default: 7)
         iv: Implied volatility (optional)
+        df: Daily OHLCV with lowercase columns (downloaded if None)
+        verbose: Print the report (False for programmatic/batch use)
 
     Returns:
         Dict with recommendation, confidence, reasons, watch levels
     """
 
-    print(f"\n{'='*80}")
-    print(f"  QUICK TRADE CHECK: {ticker} {strike} {option_type} @ ${premium:.2f}")
-    print(f"{'='*80}\n")
+    if verbose:
+        print(f"\n{'='*80}")
+        print(f"  QUICK TRADE CHECK: {ticker} {strike} {option_type} @ ${premium:.2f}")
+        print(f"{'='*80}\n")
 
     # Fetch current data
     try:
-        df = yf.download(ticker, period="3mo", interval="1d", progress=False)
-
-        # Flatten columns
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = [col[0].lower() for col in df.columns]
-        else:
-            df.columns = [str(col).lower() for col in df.columns]
+        if df is None:
+            df = get_ohlcv(ticker, period="3mo", interval="1d", ttl=OHLCV_CACHE_TTL)
 
         if df.empty:
             return {
@@ -65,12 +107,14 @@ def quick_check(
             }
 
         # Get current price
+        close = df['close'].to_numpy(dtype=float)
         if underlying_price is None:
-            underlying_price = df['close'].iloc[-1]
+            underlying_price = close[-1]
 
-        print(f"Underlying: ${underlying_price:.2f}")
-        print(f"DTE: {dte} days")
-        print(f"Premium: ${premium:.2f}\n")
+        if verbose:
+            print(f"Underlying: ${underlying_price:.2f}")
+            print(f"DTE: {dte} days")
+            print(f"Premium: ${premium:.2f}\n")
 
     except Exception as e:
         return {
@@ -82,43 +126,22 @@ def quick_check(
 
     # Calculate key metrics
     try:
-        # ATR
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift())
-        low_close = abs(df['low'] - df['close'].shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(14).mean().iloc[-1]
-
-        # Support/Resistance zones
-        sr_zones = calculate_support_resistance_zones(
-            df=df,
-            current_price=underlying_price,
-            ticker=ticker,
-            lookback_days=60,
-            atr=atr,
-            max_levels=5
-        )
-
-        # Trend analysis
-        trend_result = identify_trend(df, underlying_price)
-        trend_analysis = {
-            'trend': trend_result.get('trend', 'sideways'),
-            'counter_trend': False
-        }
+        # Raw column arrays (close taken above) - all the scalar math below
+        # indexes these directly
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        volume = df['volume'].to_numpy(dtype=float)
 
-        # Check if counter-trend
-        if option_type == 'CALL' and trend_result.get('trend') == 'downtrend':
-            trend_analysis['counter_trend'] = True
-        elif option_type == 'PUT' and trend_result.get('trend') == 'uptrend':
-            trend_analysis['counter_trend'] = True
+        # ATR
+        atr = latest_atr(high, low, close, period=14)
 
         # Recent price action
-        recent_5d = df['close'].iloc[-5:]
-        price_change_5d = (underlying_price - recent_5d.iloc[0]) / recent_5d.iloc[0] * 100
+        recent_5d = close[-5:]
+        price_change_5d = (underlying_price - recent_5d[0]) / recent_5d[0] * 100
 
-        # Volume analysis
-        avg_volume = df['volume'].tail(20).mean()
-        current_volume = df['volume'].iloc[-1]
+        # Volume analysis (nanmean skips missing bars like Series.mean)
+        avg_volume = np.nanmean(volume[-20:])
+        current_volume = volume[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
 
     except Exception as e:
@@ -164,7 +187,82 @@ def quick_check(
             red_flags.append(f"Strike {distance_pct:.1f}% OTM")
             confidence -= 5
 
-    # 2. Check resistance/support zones
+    # 2. Recent momentum
+    if option_type == 'CALL':
+        if price_change_5d > 3:
+            green_flags.append(f"Strong 5-day momentum: +{price_change_5d:.1f}%")
+            confidence += 10
+        elif price_change_5d < -3:
+            red_flags.append(f"Negative momentum: {price_change_5d:.1f}% (5d)")
+            confidence -= 10
+    else:
+        if price_change_5d < -3:
+            green_flags.append(f"Bearish momentum: {price_change_5d:.1f}% (5d)")
+            confidence += 10
+        elif price_change_5d > 3:
+            red_flags.append(f"Against momentum: +{price_change_5d:.1f}% (5d)")
+            confidence -= 10
+
+    # 3. Volume
+    if volume_ratio > 1.5:
+        green_flags.append(f"High volume: {volume_ratio:.1f}x average")
+        confidence += 5
+    elif volume_ratio < 0.7:
+        red_flags.append(f"Low volume: {volume_ratio:.1f}x average")
+        confidence -= 5
+
+    # 4. Time decay risk (DTE)
+    if dte <= 3:
+        red_flags.append(f"Short DTE ({dte}d) - high theta decay risk")
+        confidence -= 10
+    elif dte >= 7:
+        green_flags.append(f"Good time buffer ({dte}d)")
+        confidence += 5
+
+    # 5. Premium/Risk ratio
+    if premium < 0.50:
+        red_flags.append("Low premium - poor R/R for stops")
+        confidence -= 10
+    elif premium > 2.00:
+        green_flags.append("Adequate premium for risk management")
+        confidence += 5
+
+    # Early exit: if even the best S/R and trend outcome can't lift the
+    # setup out of NO territory, skip that analysis entirely. The result then
+    # carries the basic-checks confidence and no S/R-derived watch levels.
+    deferred_bonus = MAX_DEFERRED_BONUS['CALL'] if option_type == 'CALL' else MAX_DEFERRED_BONUS['PUT']
+    skipped_sr = confidence + deferred_bonus < 30
+    if skipped_sr:
+        red_flags.append("Fails basic checks - S/R and trend analysis skipped")
+        sr_zones = {}
+        trend_analysis = {}
+    else:
+        try:
+            # Support/Resistance zones
+            sr_zones = _sr_zones_memo(df, ticker, underlying_price, atr)
+
+            # Trend analysis
+            trend_result = identify_trend(df, underlying_price)
+            trend_analysis = {
+                'trend': trend_result.get('trend', 'sideways'),
+                'counter_trend': False
+            }
+
+            # Check if counter-trend
+            if option_type == 'CALL' and trend_result.get('trend') == 'downtrend':
+                trend_analysis['counter_trend'] = True
+            elif option_type == 'PUT' and trend_result.get('trend') == 'uptrend':
+                trend_analysis['counter_trend'] = True
+
+        except Exception as e:
+            return {
+                'recommendation': 'ERROR',
+                'confidence': 0,
+                'reasons': [f'Analysis error: {e}'],
+                'watch_levels': {}
+            }
+
+    # 6. Check resistance/support zones
     if option_type == 'CALL':
         resistance_zones = sr_zones.get('resistance_zones', [])
         support_zones = sr_zones.get('support_zones', [])
@@ -203,7 +301,7 @@ def quick_check(
                 red_flags.append(f"At support ${nearest_s['price']:.0f} - may bounce")
                 confidence -= 15
 
-    # 3. Trend analysis
+    # 7. Trend analysis
     if option_type == 'CALL':
         if trend_analysis.get('counter_trend'):
             red_flags.append("Counter-trend trade (downtrend, taking calls)")
@@ -219,46 +317,6 @@ def quick_check(
             green_flags.append("With the trend (downtrend)")
             confidence += 15
 
-    # 4. Recent momentum
-    if option_type == 'CALL':
-        if price_change_5d > 3:
-            green_flags.append(f"Strong 5-day momentum: +{price_change_5d:.1f}%")
-            confidence += 10
-        elif price_change_5d < -3:
-            red_flags.append(f"Negative momentum: {price_change_5d:.1f}% (5d)")
-            confidence -= 10
-    else:
-        if price_change_5d < -3:
-            green_flags.append(f"Bearish momentum: {price_change_5d:.1f}% (5d)")
-            confidence += 10
-        elif price_change_5d > 3:
-            red_flags.append(f"Against momentum: +{price_change_5d:.1f}% (5d)")
-            confidence -= 10
-
-    # 5. Volume
-    if volume_ratio > 1.5:
-        green_flags.append(f"High volume: {volume_ratio:.1f}x average")
-        confidence += 5
-    elif volume_ratio < 0.7:
-        red_flags.append(f"Low volume: {volume_ratio:.1f}x average")
-        confidence -= 5
-
-    # 6. Time decay risk (DTE)
-    if dte <= 3:
-        red_flags.append(f"Short DTE ({dte}d) - high theta decay risk")
-        confidence -= 10
-    elif dte >= 7:
-        green_flags.append(f"Good time buffer ({dte}d)")
-        confidence += 5
-
-    # 7. Premium/Risk ratio
-    if premium < 0.50:
-        red_flags.append("Low premium - poor R/R for stops")
-        confidence -= 10
-    elif premium > 2.00:
-        green_flags.append("Adequate premium for risk management")
-        confidence += 5
-
     # Clamp confidence
     confidence = max(0, min(100, confidence))
 
@@ -283,7 +341,9 @@ def quick_check(
     # Build watch levels
     watch_levels = {}
 
-    if option_type == 'CALL':
+    if skipped_sr:
+        pass  # No S/R levels - a fallback stop would pass for real support
+    elif option_type == 'CALL':
         resistance_zones = sr_zones.get('resistance_zones', [])
         support_zones = sr_zones.get('support_zones', [])
 
@@ -312,82 +372,83 @@ def quick_check(
             watch_levels['stop_level'] = underlying_price * 1.03
 
     # Print results
-    print(f"{'='*80}")
-    print(f"  RECOMMENDATION: {rec_label}")
-    print(f"  Confidence: {confidence}%")
-    print(f"{'='*80}\n")
-
-    if green_flags:
-        print("GREEN FLAGS:")
-        for flag in green_flags:
-            print(f"  [+] {flag}")
-        print()
-
-    if red_flags:
-        print("RED FLAGS:")
-        for flag in red_flags:
-            print(f"  [-] {flag}")
-        print()
-
-    if recommendation in ["YES", "MARGINAL"]:
-        print("IF YOU TAKE IT - KEY WATCH LEVELS:")
-        print("-" * 40)
-
-        if option_type == 'CALL':
-            if 'breakout_level' in watch_levels:
-                print(f"  BREAKOUT ALERT: ${watch_levels['breakout_level']:.2f}")
-                print(f"    → If breaks above with volume >1.5x avg:")
-                print(f"       - HOLD RUNNER (don't exit early)")
-                print(f"       - Trail stop to ${watch_levels['breakout_level'] * 0.995:.2f}")
-                if 'next_target' in watch_levels:
-                    print(f"       - New target: ${watch_levels['next_target']:.2f}")
+    if verbose:
+        print(f"{'='*80}")
+        print(f"  RECOMMENDATION: {rec_label}")
+        print(f"  Confidence: {confidence}%")
+        print(f"{'='*80}\n")
+
+        if green_flags:
+            print("GREEN FLAGS:")
+            for flag in green_flags:
+                print(f"  [+] {flag}")
+            print()
+
+        if red_flags:
+            print("RED FLAGS:")
+            for flag in red_flags:
+                print(f"  [-] {flag}")
+            print()
+
+        if recommendation in ["YES", "MARGINAL"]:
+            print("IF YOU TAKE IT - KEY WATCH LEVELS:")
+            print("-" * 40)
+
+            if option_type == 'CALL':
+                if 'breakout_level' in watch_levels:
+                    print(f"  BREAKOUT ALERT: ${watch_levels['breakout_level']:.2f}")
+                    print(f"    → If breaks above with volume >1.5x avg:")
+                    print(f"       - HOLD RUNNER (don't exit early)")
+                    print(f"       - Trail stop to ${watch_levels['breakout_level'] * 0.995:.2f}")
+                    if 'next_target' in watch_levels:
+                        print(f"       - New target: ${watch_levels['next_target']:.2f}")
+                    print()
+
+                print(f"  REJECTION ALERT: Watch for bearish candles near resistance")
+                print(f"    → Shooting star, bearish engulfing, long upper wick:")
+                print(f"       - EXIT 60-80% immediately")
+                print(f"       - Lock partial profit before reversal")
                 print()
 
-            print(f"  REJECTION ALERT: Watch for bearish candles near resistance")
-            print(f"    → Shooting star, bearish engulfing, long upper wick:")
-            print(f"       - EXIT 60-80% immediately")
-            print(f"       - Lock partial profit before reversal")
+                if 'stop_level' in watch_levels:
+                    print(f"  STOP LOSS: Below ${watch_levels['stop_level']:.2f}")
+                    print(f"    → Or -1R on premium (~${premium * 0.5:.2f})")
+
+            else:  # PUT
+                if 'breakdown_level' in watch_levels:
+                    print(f"  BREAKDOWN ALERT: ${watch_levels['breakdown_level']:.2f}")
+                    print(f"    → If breaks below with volume >1.5x avg:")
+                    print(f"       - HOLD RUNNER")
+                    print(f"       - Trail stop to ${watch_levels['breakdown_level'] * 1.005:.2f}")
+
+                print(f"  REJECTION ALERT: Watch for bullish candles near support")
+                print(f"    → Hammer, bullish engulfing:")
+                print(f"       - EXIT 60-80% immediately")
+
+            print()
+            print(f"  TIME RISK: If no move in {max(2, dte//3)} days → theta decay accelerates")
             print()
 
-            if 'stop_level' in watch_levels:
-                print(f"  STOP LOSS: Below ${watch_levels['stop_level']:.2f}")
-                print(f"    → Or -1R on premium (~${premium * 0.5:.2f})")
-
-        else:  # PUT
-            if 'breakdown_level' in watch_levels:
-                print(f"  BREAKDOWN ALERT: ${watch_levels['breakdown_level']:.2f}")
-                print(f"    → If breaks below with volume >1.5x avg:")
-                print(f"       - HOLD RUNNER")
-                print(f"       - Trail stop to ${watch_levels['breakdown_level'] * 1.005:.2f}")
-
-            print(f"  REJECTION ALERT: Watch for bullish candles near support")
-            print(f"    → Hammer, bullish engulfing:")
-            print(f"       - EXIT 60-80% immediately")
-
-        print()
-        print(f"  TIME RISK: If no move in {max(2, dte//3)} days → theta decay accelerates")
-        print()
-
-    elif recommendation == "LEAN NO":
-        print("WHY PASSING:")
-        print("-" * 40)
-        print(f"  Too many red flags. Wait for:")
-        if option_type == 'CALL':
-            print(f"  - Clear break above resistance")
-            print(f"  - Strong volume confirmation")
-            print(f"  - Better trend alignment")
-        else:
-            print(f"  - Clear break below support")
-            print(f"  - Better risk/reward setup")
-        print()
+        elif recommendation == "LEAN NO":
+            print("WHY PASSING:")
+            print("-" * 40)
+            print(f"  Too many red flags. Wait for:")
+            if option_type == 'CALL':
+                print(f"  - Clear break above resistance")
+                print(f"  - Strong volume confirmation")
+                print(f"  - Better trend alignment")
+            else:
+                print(f"  - Clear break below support")
+                print(f"  - Better risk/reward setup")
+            print()
 
-    else:  # NO
-        print("STRONG PASS:")
-        print("-" * 40)
-        print("  Setup quality too low. Look for better opportunities.")
-        print()
+        else:  # NO
+            print("STRONG PASS:")
+            print("-" * 40)
+            print("  Setup quality too low. Look for better opportunities.")
+            print()
 
-    print(f"{'='*80}\n")
+        print(f"{'='*80}\n")
 
     return {
         'recommendation': recommendation,
@@ -402,6 +463,29 @@ def quick_check(
     }
 
 
+def quick_check_batch(trades: List[Dict[str, Any]], verbose: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run quick_check over several trades with one download for all tickers.
+
+    Args:
+        trades: List of quick_check keyword dicts (ticker, strike, option_type, premium, ...)
+        verbose: Print each trade's report (quiet by default)
+
+    Returns:
+        List of quick_check results, in the same order as trades
+    """
+    frames = get_ohlcv_batch(
+        [trade['ticker'] for trade in trades],
+        period="3mo",
+        interval="1d",
+        ttl=OHLCV_CACHE_TTL
+    )
+    return [
+        quick_check(**trade, df=frames[trade['ticker']], verbose=verbose)
+        for trade in trades
+    ]
+
+
 # CLI usage
 if __name__ == "__main__":
     import argparse
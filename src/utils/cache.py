@@ -2,44 +2,93 @@
 Simple file-based cache with TTL
 """
 
+import copy
+import functools
+import hashlib
+import inspect
+import marshal
+import numbers
 import os
-import json
+import pickle
+import re
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
 from pathlib import Path
 
 
-class SimpleCache:
-    """Simple file-based cache with time-to-live."""
+# Leading byte of every entry file; bump when the stored layout changes
+_FORMAT_VERSION = b"\x01"
+
+# File names of cache entries: a 32-hex _hash_key digest plus a known suffix
+_ENTRY_NAME = re.compile(r"[0-9a-f]{32}\.(?:pkl|pkl\.tmp|json)")
+
 
-    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600):
+class SimpleCache:
+    """
+    Simple file-based cache with time-to-live.
+
+    Entries are pickled, so numpy scalars and DataFrames round-trip as-is.
+    Unpickling runs code named in the file, so cache_dir must only be writable
+    by the user running the analyzer; it is created owner-only for that reason.
+    Each file starts with a format version byte - files written in another
+    format are treated as misses, not as corrupt data.
+    Recently used entries are also held in memory (bounded LRU) so repeat
+    lookups within a process skip the disk entirely. The LRU stores and hands
+    out copies, so callers can modify what they get back; it is thread-safe.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600, memory_size: int = 256):
         """
         Initialize cache.
 
         Args:
             cache_dir: Directory to store cache files
             default_ttl: Default time-to-live in seconds
+            memory_size: Max entries kept in the in-process LRU
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(mode=0o700, exist_ok=True)
         self.default_ttl = default_ttl
+        self.memory_size = memory_size
+        # hashed key -> (expires_at, value)
+        self._mem: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._mem_lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired."""
-        cache_file = self.cache_dir / f"{self._hash_key(key)}.json"
+        hashed = self._hash_key(key)
+
+        with self._mem_lock:
+            entry = self._mem.get(hashed)
+            if entry is not None:
+                if time.time() <= entry[0]:
+                    self._mem.move_to_end(hashed)
+                else:
+                    del self._mem[hashed]
+                    entry = None
+        if entry is not None:
+            return copy.deepcopy(entry[1])
+
+        cache_file = self.cache_dir / f"{hashed}.pkl"
 
         if not cache_file.exists():
             return None
 
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            with open(cache_file, 'rb') as f:
+                if f.read(1) != _FORMAT_VERSION:
+                    cache_file.unlink()  # Written by another cache format
+                    return None
+                data = pickle.load(f)
 
             # Check if expired
             if time.time() > data['expires_at']:
                 cache_file.unlink()  # Delete expired
                 return None
 
+            self._remember(hashed, data['expires_at'], data['value'])
             return data['value']
         except Exception:
             return None
@@ -49,7 +98,8 @@ class SimpleCache:
         if ttl is None:
             ttl = self.default_ttl
 
-        cache_file = self.cache_dir / f"{self._hash_key(key)}.json"
+        hashed = self._hash_key(key)
+        cache_file = self.cache_dir / f"{hashed}.pkl"
 
         try:
             data = {
@@ -57,23 +107,43 @@ class SimpleCache:
                 'expires_at': time.time() + ttl,
                 'key': key
             }
-
-            with open(cache_file, 'w') as f:
-                json.dump(data, f)
+            self._remember(hashed, data['expires_at'], value)
+
+            # Write beside the target and swap in, so a crash mid-write
+            # never leaves a truncated entry behind
+            tmp_file = cache_file.with_suffix('.pkl.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(_FORMAT_VERSION)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
         except Exception:
             pass  # Silently fail caching
 
+    def _remember(self, hashed: str, expires_at: float, value: Any):
+        """Put a copy of value in the in-memory LRU, evicting the oldest past memory_size."""
+        value = copy.deepcopy(value)
+        with self._mem_lock:
+            self._mem[hashed] = (expires_at, value)
+            self._mem.move_to_end(hashed)
+            if len(self._mem) > self.memory_size:
+                self._mem.popitem(last=False)
+
     def _hash_key(self, key: str) -> str:
         """Create safe filename from key."""
-        import hashlib
-        return hashlib.md5(key.encode()).hexdigest()
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
     def clear(self):
         """Clear all cache files."""
-        for cache_file in self.cache_dir.glob("*.json"):
+        with self._mem_lock:
+            self._mem.clear()
+        # Only remove files named by _hash_key (legacy .json entries included) -
+        # cache_dir may be shared with other files
+        for cache_file in self.cache_dir.iterdir():
+            if not _ENTRY_NAME.fullmatch(cache_file.name):
+                continue
             try:
-                cache_file.unlink()
-            except Exception:
+                cache_file.unlink(missing_ok=True)
+            except OSError:
                 pass
 
 
@@ -94,3 +164,73 @@ def set_cache(key: str, value: Any, ttl: Optional[int] = None):
 def clear_cache():
     """Clear global cache."""
     _cache.clear()
+
+
+def _key_scalar(value: Any) -> str:
+    """Key fragment for a plain argument; anything without a stable repr is rejected."""
+    if value is None or isinstance(value, (bool, str)):
+        return repr(value)
+    if isinstance(value, numbers.Integral):
+        return repr(int(value))
+    if isinstance(value, numbers.Real):
+        return repr(float(value))
+    if isinstance(value, tuple):
+        return "(" + ",".join(_key_scalar(v) for v in value) + ")"
+    raise TypeError(f"ta_cache cannot key on a {type(value).__name__} argument")
+
+
+def _bars_key(bars: Any) -> str:
+    """Key fragment for a bar frame: its span, length and a hash of the last bar."""
+    import pandas as pd
+
+    if not isinstance(bars, (pd.DataFrame, pd.Series)) or not isinstance(bars.index, pd.DatetimeIndex):
+        raise TypeError("ta_cache needs a DataFrame/Series with a DatetimeIndex as first argument")
+    if bars.empty:
+        raise TypeError("ta_cache cannot key on empty bars")
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(pd.util.hash_pandas_object(bars.iloc[-1:], index=True).to_numpy().tobytes())
+    digest.update(repr(list(bars.columns) if isinstance(bars, pd.DataFrame) else [bars.name]).encode())
+    return f"{bars.index[0].isoformat()}:{bars.index[-1].isoformat()}:{len(bars)}:{digest.hexdigest()}"
+
+
+def ta_cache(ttl: Optional[int] = None) -> Callable:
+    """
+    Memoize a technical-analysis function through the global cache.
+
+    The decorated function takes its bars as first argument. The key is
+    (ticker, last bar timestamp, named arguments), plus a hash of the
+    function's own code so an edit to it is never answered from the cache.
+    Edits to functions it calls are not tracked - clear the cache after those.
+
+    The ticker comes from a ``ticker`` argument or ``bars.attrs['ticker']``;
+    calls without one run uncached. Other arguments must be None, bool, str,
+    numbers or tuples of those - anything else raises TypeError.
+
+    Args:
+        ttl: Time-to-live in seconds (cache default if None)
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+        code = hashlib.blake2b(marshal.dumps(fn.__code__), digest_size=8).hexdigest()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            (_, bars), *params = bound.arguments.items()
+            bars_key = _bars_key(bars)
+            ticker = bound.arguments.get('ticker') or bars.attrs.get('ticker')
+            parts = ",".join(f"{name}={_key_scalar(value)}" for name, value in params)
+            if not ticker:
+                return fn(*args, **kwargs)
+
+            key = f"ta:{fn.__module__}.{fn.__qualname__}:{code}:{ticker}:{bars_key}({parts})"
+            cached = get_cache(key)
+            if cached is not None:
+                return cached
+
+            result = fn(*args, **kwargs)
+            set_cache(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,130 @@
+"""
+Shared YAML config loader
+Parsed configs are cached per file and handed out as read-only views
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed config cache: abspath -> (mtime_ns, size, config). Bounded LRU.
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Mapping[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 100
+
+# JSON copies of parsed configs live in the user's cache dir - never next to the
+# config file, and the same wherever the process starts
+_SIDECAR_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "trade-analyzer",
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _sidecar_path(path: str) -> str:
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(_SIDECAR_DIR, f"config-{digest}.json")
+
+
+def _read_json_sidecar(path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the JSON copy of a parsed config if it was written for this exact file version."""
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if sidecar.get("mtime_ns") != st.st_mtime_ns or sidecar.get("size") != st.st_size:
+        return None
+    return sidecar.get("config")
+
+
+def _write_json_sidecar(path: str, st: os.stat_result, config: Dict[str, Any]) -> None:
+    """
+    Store the parsed config as JSON in the user cache dir (JSON loads ~10x faster).
+
+    Skipped when the config does not survive a JSON round trip unchanged (dates,
+    non-string keys) or the cache dir is not writable. Written atomically.
+    """
+    try:
+        text = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "config": config})
+        if json.loads(text)["config"] != config:
+            return
+        sidecar = _sidecar_path(path)
+        os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load_config(config_path: str) -> Mapping[str, Any]:
+    """
+    Load a YAML config file, reusing the parsed result while the file is unchanged.
+
+    Entries are validated against the file's mtime and size, so edits are picked up
+    on the next load. Across processes, a JSON copy in the user cache dir stamped
+    with the same mtime/size stands in for the YAML parse. The result is a read-only
+    view shared by every caller loading the same file; copy a section into a dict
+    before changing it.
+    """
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(path)
+        return cached[2]
+
+    raw = _read_json_sidecar(path, st)
+    if raw is None:
+        with open(path, 'rb') as f:  # raw bytes straight to libyaml, no text decoding layer
+            raw = yaml.load(f, Loader=_YamlLoader) or {}
+        _write_json_sidecar(path, st, raw)
+    config = _freeze(raw)
+
+    _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
+    _CONFIG_CACHE.move_to_end(path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+        _CONFIG_CACHE.popitem(last=False)
+    return config
+
+
+def clear_config_cache() -> None:
+    """
+    Drop parsed configs and their JSON copies, so the next load re-parses
+    the YAML (tests, forced reloads).
+    """
+    _CONFIG_CACHE.clear()
+    try:
+        names = os.listdir(_SIDECAR_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith("config-") and name.endswith(".json"):
+            try:
+                os.unlink(os.path.join(_SIDECAR_DIR, name))
+            except OSError:
+                pass
@@ -0,0 +1,139 @@
+"""
+Cached OHLCV downloads shared by the CLI tools and test scripts
+yfinance is imported on first cache miss, so cache hits never load it
+"""
+
+from datetime import date
+from typing import Dict, List
+
+import pandas as pd
+
+from .cache import get_cache, set_cache
+
+
+def _ohlcv_key(ticker: str, period: str, interval: str, ttl: int) -> str:
+    """
+    Cache key for one ticker's bars, bucketed by calendar day.
+
+    The TTL is part of the key so a caller wanting fresher bars never gets an
+    entry written by one that tolerates older ones.
+    """
+    return f"ohlcv:{ticker}:{date.today().isoformat()}:{period}:{interval}:{ttl}"
+
+
+def get_ohlcv(
+    ticker: str,
+    period: str = "3mo",
+    interval: str = "1d",
+    ttl: int = 3600
+) -> pd.DataFrame:
+    """
+    Download OHLCV bars with lowercase columns, cached per trading day.
+
+    Args:
+        ticker: Stock ticker
+        period: yfinance period (e.g. "3mo")
+        interval: yfinance interval (e.g. "1d")
+        ttl: Seconds a cached download stays valid
+
+    Returns:
+        DataFrame with open/high/low/close/volume columns (empty if fetch failed)
+    """
+    cache_key = _ohlcv_key(ticker, period, interval, ttl)
+    cached = get_cache(cache_key)
+    if cached is not None:
+        return cached
+
+    import yfinance as yf
+
+    # Adjusted OHLC only - no Adj Close or dividend/split columns to carry around
+    df = yf.download(
+        ticker,
+        period=period,
+        interval=interval,
+        auto_adjust=True,
+        actions=False,
+        threads=False,
+        progress=False
+    )
+
+    # Flatten (field, ticker) columns and lowercase in one vectorized pass
+    columns = df.columns
+    if isinstance(columns, pd.MultiIndex):
+        columns = columns.get_level_values(0)
+    df.columns = columns.astype(str).str.lower()
+    df.attrs['ticker'] = ticker
+
+    if not df.empty:
+        set_cache(cache_key, df, ttl=ttl)
+
+    return df
+
+
+def get_ohlcv_batch(
+    tickers: List[str],
+    period: str = "3mo",
+    interval: str = "1d",
+    ttl: int = 3600
+) -> Dict[str, pd.DataFrame]:
+    """
+    Download OHLCV bars for several tickers in one threaded request.
+
+    Tickers already in the cache are served from it; the rest are fetched
+    together and cached individually, so later get_ohlcv calls hit too.
+    A lone missing ticker, or one the batch result does not contain, is
+    fetched through get_ohlcv instead.
+
+    Returns:
+        Dict of ticker -> DataFrame (same shape as get_ohlcv; empty if missing)
+    """
+    frames = {}
+    missing = []
+    for ticker in dict.fromkeys(tickers):
+        cached = get_cache(_ohlcv_key(ticker, period, interval, ttl))
+        if cached is not None:
+            frames[ticker] = cached
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return frames
+    if len(missing) == 1:
+        # Single-ticker downloads come back with flat columns on older yfinance
+        frames[missing[0]] = get_ohlcv(missing[0], period=period, interval=interval, ttl=ttl)
+        return frames
+
+    import yfinance as yf
+
+    df = yf.download(
+        " ".join(missing),
+        period=period,
+        interval=interval,
+        group_by='ticker',
+        auto_adjust=True,
+        actions=False,
+        threads=True,
+        progress=False
+    )
+
+    # yfinance may label a ticker in a different case than it was requested in
+    labels = {}
+    if isinstance(df.columns, pd.MultiIndex):
+        labels = {str(label).upper(): label for label in df.columns.get_level_values(0).unique()}
+
+    for ticker in missing:
+        label = labels.get(ticker.upper())
+        # Rows are aligned across tickers - drop dates this one has no bars for
+        sub = df[label].dropna(how='all') if label is not None else None
+        if sub is None or sub.empty:
+            # Not split out of the batch - fetch it on its own rather than report no data
+            frames[ticker] = get_ohlcv(ticker, period=period, interval=interval, ttl=ttl)
+            continue
+
+        sub = sub.copy()
+        sub.columns = sub.columns.astype(str).str.lower()
+        sub.attrs['ticker'] = ticker
+        set_cache(_ohlcv_key(ticker, period, interval, ttl), sub, ttl=ttl)
+        frames[ticker] = sub
+
+    return frames
@@ -0,0 +1,139 @@
+"""
+Tests for the file-based TTL cache
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+from utils.cache import SimpleCache
+
+
+def test_clear_keeps_unrelated_files(tmp_path):
+    cache = SimpleCache(cache_dir=str(tmp_path))
+    cache.set("a", 1)
+    (tmp_path / f"{'0' * 32}.json").write_text("{}")  # entry from the old JSON format
+    (tmp_path / f"{'f' * 32}.pkl.tmp").write_bytes(b"")
+    (tmp_path / "config-2919f6bac8d9b702.json").write_text("{}")
+    (tmp_path / "notes.txt").write_text("keep me")
+    (tmp_path / "subdir").mkdir()
+
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "config-2919f6bac8d9b702.json", "notes.txt", "subdir"
+    ]
+
+
+def test_returned_values_are_copies(tmp_path):
+    import pandas as pd
+
+    cache = SimpleCache(cache_dir=str(tmp_path))
+    df = pd.DataFrame({'close': [1.0, 2.0]})
+    cache.set("bars", df)
+    df['close'] = 0.0  # caller keeps editing its own frame
+
+    first = cache.get("bars")
+    first['sma'] = first['close']  # e.g. adding an indicator column
+    second = cache.get("bars")
+
+    assert list(second.columns) == ['close']
+    assert second['close'].tolist() == [1.0, 2.0]
+
+
+def test_memory_lru_is_thread_safe(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = SimpleCache(cache_dir=str(tmp_path), memory_size=8)
+
+    def work(i):
+        key = f"k{i % 32}"
+        cache.set(key, {'i': i % 32})
+        value = cache.get(key)
+        return value is None or value['i'] == i % 32
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(work, range(2000)))
+    assert len(cache._mem) <= 8
+
+
+def _bars(n=30):
+    import numpy as np
+    import pandas as pd
+
+    index = pd.date_range("2024-01-02", periods=n, freq="B")
+    close = np.linspace(100.0, 110.0, n)
+    return pd.DataFrame({'close': close}, index=index)
+
+
+def _counting_sma(monkeypatch, tmp_path):
+    """An SMA decorated with ta_cache over a private cache, plus its call log."""
+    import utils.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_cache", SimpleCache(cache_dir=str(tmp_path)))
+    calls = []
+
+    @cache_module.ta_cache()
+    def sma(df, ticker, window=5):
+        calls.append(window)
+        return float(df['close'].iloc[-window:].mean())
+
+    return sma, calls
+
+
+def test_ta_cache_hit_and_miss(monkeypatch, tmp_path):
+    sma, calls = _counting_sma(monkeypatch, tmp_path)
+    df = _bars()
+
+    first = sma(df, "AAPL", window=5)
+    assert sma(df, ticker="AAPL", window=5) == first  # hit - same key however passed
+    assert calls == [5]
+
+    sma(df, "AAPL", window=10)  # different parameter
+    sma(df, "MSFT", window=5)   # different ticker
+    assert calls == [5, 10, 5]
+
+
+def test_ta_cache_new_bar_invalidates(monkeypatch, tmp_path):
+    import pandas as pd
+
+    sma, calls = _counting_sma(monkeypatch, tmp_path)
+    df = _bars()
+    sma(df, "AAPL")
+
+    next_bar = pd.DataFrame({'close': [200.0]}, index=[df.index[-1] + pd.offsets.BDay()])
+    assert sma(pd.concat([df, next_bar]), "AAPL") != sma(df, "AAPL")
+    assert len(calls) == 2
+
+    revised = df.copy()
+    revised.iloc[-1, 0] = 50.0  # last bar still forming
+    sma(revised, "AAPL")
+    assert len(calls) == 3
+
+
+def test_ta_cache_rejects_unkeyable_arguments(monkeypatch, tmp_path):
+    sma, calls = _counting_sma(monkeypatch, tmp_path)
+
+    with pytest.raises(TypeError):
+        sma(_bars(), "AAPL", window=object())
+    with pytest.raises(TypeError):
+        sma(_bars().reset_index(drop=True), "AAPL")
+    assert calls == []
+
+
+def test_entries_from_another_format_are_misses(tmp_path):
+    import pickle
+
+    cache = SimpleCache(cache_dir=str(tmp_path))
+    cache.set("a", {'x': 1})
+    assert SimpleCache(cache_dir=str(tmp_path)).get("a") == {'x': 1}  # read back from disk
+
+    # Same key written without the version byte (e.g. by an older release)
+    entry = next(tmp_path.glob("*.pkl"))
+    entry.write_bytes(pickle.dumps({'value': {'x': 2}, 'expires_at': float('inf'), 'key': "a"}))
+
+    assert SimpleCache(cache_dir=str(tmp_path)).get("a") is None
+    assert not entry.exists()
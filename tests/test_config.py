@@ -0,0 +1,62 @@
+"""
+Tests for the shared YAML config loader
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from collections import OrderedDict
+
+import pytest
+
+import utils.config as config_module
+from utils.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Private JSON-copy dir and an empty in-process cache per test."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(config_module, "_SIDECAR_DIR", str(cache_dir))
+    monkeypatch.setattr(config_module, "_CONFIG_CACHE", OrderedDict())
+    return cache_dir
+
+
+def _write_config(path, max_risk):
+    path.write_text(f"risk:\n  max_risk_per_trade: {max_risk}\n")
+
+
+def test_sidecar_cold_warm_and_stale(tmp_path, isolated_cache, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path, 0.02)
+
+    # Cold: parsed from YAML, JSON copy written to the cache dir only
+    assert load_config(str(config_path))["risk"]["max_risk_per_trade"] == 0.02
+    assert [p.name.startswith("config-") for p in isolated_cache.iterdir()] == [True]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache", "config.yaml"]
+
+    # Warm: a fresh process (empty memory cache) reads the JSON copy, not the YAML
+    config_module._CONFIG_CACHE.clear()
+    with monkeypatch.context() as m:
+        m.setattr(config_module.yaml, "load", lambda *a, **k: pytest.fail("YAML re-parsed"))
+        assert load_config(str(config_path))["risk"]["max_risk_per_trade"] == 0.02
+
+    # Stale: a newer mtime invalidates the copy
+    config_module._CONFIG_CACHE.clear()
+    _write_config(config_path, 0.03)
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_config(str(config_path))["risk"]["max_risk_per_trade"] == 0.03
+
+
+def test_loaded_config_is_read_only(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("risk:\n  levels: [1, 2]\n")
+
+    config = load_config(str(config_path))
+
+    assert config is load_config(str(config_path))  # shared between callers
+    with pytest.raises(TypeError):
+        config["risk"]["levels"] = []
+    assert config["risk"]["levels"] == (1, 2)
@@ -15,11 +15,8 @@ try:
 except ImportError:
     pass
 
-import yfinance as yf
-import pandas as pd
-from datetime import datetime
-
 # Import modules
+from analysis.indicators import latest_atr
 from analysis.price_action import calculate_support_resistance_zones
 from analysis.volume_analysis import (
     calculate_vwap,
@@ -29,6 +26,7 @@ from analysis.volume_analysis import (
 )
 from analysis.candlestick_patterns import get_pattern_signals
 from analysis.trend_analysis import identify_trend, calculate_adx
+from utils.ohlcv import get_ohlcv
 
 from parser.trade_parser import TradeParser
 from risk_engine.risk_engine import RiskEngine
@@ -37,11 +35,12 @@ from analysis.trade_analyzer import TradeAnalyzer
 
 def calculate_atr(df, period=14):
     """Calculate ATR."""
-    high_low = df['high'] - df['low']
-    high_close = abs(df['high'] - df['close'].shift())
-    low_close = abs(df['low'] - df['close'].shift())
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return float(true_range.rolling(period).mean().iloc[-1])
+    return float(latest_atr(
+        df['high'].to_numpy(dtype=float),
+        df['low'].to_numpy(dtype=float),
+        df['close'].to_numpy(dtype=float),
+        period=period
+    ))
 
 
 def test_llm_enhanced_analysis(ticker="AAPL", option_type="CALL"):
@@ -53,12 +52,7 @@ def test_llm_enhanced_analysis(ticker="AAPL", option_type="CALL"):
 
     # Fetch data
     print("\n[1/6] Fetching market data...")
-    df = yf.download(ticker, period="3mo", interval="1d", progress=False)
-
-    # Handle columns
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-    df.columns = [str(col).lower() for col in df.columns]
+    df = get_ohlcv(ticker, period="3mo", interval="1d")
 
     current_price = float(df['close'].iloc[-1])
     atr = calculate_atr(df)
@@ -0,0 +1,83 @@
+"""
+Tests for the cached OHLCV downloads (yfinance mocked)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils.cache as cache_module
+from utils.cache import SimpleCache
+from utils.ohlcv import get_ohlcv_batch
+
+
+def _bars(base, n=5):
+    """yfinance-style OHLCV bars (capitalized columns)."""
+    close = base + np.arange(n, dtype=float)
+    index = pd.date_range("2024-01-02", periods=n, freq="B")
+    return pd.DataFrame(
+        {'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1e6},
+        index=index
+    )
+
+
+@pytest.fixture
+def download(monkeypatch, tmp_path):
+    """Fake yfinance.download over a private cache; returns the list of calls."""
+    monkeypatch.setattr(cache_module, "_cache", SimpleCache(cache_dir=str(tmp_path)))
+    calls = []
+    state = {'flat': False}
+
+    def fake_download(tickers, group_by='column', **kwargs):
+        symbols = tickers.split()
+        calls.append(symbols)
+        if state['flat'] or len(symbols) == 1:
+            # Old yfinance: flat columns, even with group_by='ticker'
+            return _bars(100.0 * len(calls))
+        # Labels come back upper-case whatever case was requested
+        return pd.concat({s.upper(): _bars(100.0 * (i + 1)) for i, s in enumerate(symbols)}, axis=1)
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(download=fake_download))
+    fake_download.state = state
+    return fake_download, calls
+
+
+def test_batch_splits_one_download_per_ticker(download):
+    _, calls = download
+
+    frames = get_ohlcv_batch(["AAPL", "msft"])
+
+    assert calls == [["AAPL", "msft"]]
+    assert frames["AAPL"]['close'].iloc[0] == 100.0
+    assert frames["msft"]['close'].iloc[0] == 200.0  # matched despite the label case
+    assert list(frames["msft"].columns) == ['open', 'high', 'low', 'close', 'volume']
+
+    # Both were cached individually
+    assert get_ohlcv_batch(["AAPL", "msft"]).keys() == frames.keys()
+    assert len(calls) == 1
+
+
+def test_batch_single_ticker_with_flat_columns(download):
+    _, calls = download
+
+    frames = get_ohlcv_batch(["AAPL"])
+
+    assert calls == [["AAPL"]]
+    assert not frames["AAPL"].empty
+    assert frames["AAPL"]['close'].iloc[0] == 100.0
+
+
+def test_batch_refetches_tickers_missing_from_download(download):
+    fake_download, calls = download
+    fake_download.state['flat'] = True  # batch result cannot be split by ticker
+
+    frames = get_ohlcv_batch(["AAPL", "MSFT"])
+
+    assert calls == [["AAPL", "MSFT"], ["AAPL"], ["MSFT"]]
+    assert all(not frames[t].empty for t in ("AAPL", "MSFT"))
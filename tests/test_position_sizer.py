@@ -0,0 +1,35 @@
+"""
+Tests for PositionSizer contract counts
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from risk_engine.position_sizer import PositionSizer
+
+
+def _plain_sizer(max_risk_per_trade):
+    """Composite sizer with every multiplier off, so risk % is just the cap."""
+    return PositionSizer({
+        'sizing': {
+            'method': 'composite',
+            'kelly': {'enabled': False},
+            'volatility': {'enabled': False},
+            'setup_quality': {'enabled': False},
+            'equity_curve': {'enabled': False},
+        },
+        'risk_management': {'limits': {'max_risk_per_trade': max_risk_per_trade}},
+    })
+
+
+def test_contracts_at_exact_risk_boundary():
+    # 1700.0000000000002 / 170.00000000000003 rounds to exactly 10.0, while
+    # floor division would give 9 - the count must stay 10
+    result = _plain_sizer(0.017).calculate_position_size(
+        account_value=100000,
+        entry_price=2.97,
+        stop_loss=1.27,
+        setup_score=80
+    )
+    assert result['contracts'] == 10
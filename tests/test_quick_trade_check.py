@@ -0,0 +1,117 @@
+"""
+Tests for the quick pre-trade go/no-go check
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+
+import src.tools.quick_trade_check as qtc
+
+
+def _falling_frame(n=63):
+    """Daily bars in a steady decline on fading volume."""
+    rng = np.random.default_rng(7)
+    close = 250 - np.arange(n) * 2.0 + rng.standard_normal(n) * 0.5
+    open_ = close + rng.standard_normal(n) * 0.3
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    volume = np.linspace(5e6, 1e6, n)
+    index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=n, freq='B')
+    return pd.DataFrame(
+        {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=index
+    )
+
+
+def test_early_exit_matches_full_path_verdict(monkeypatch):
+    df = _falling_frame()
+    # Far OTM, short-dated, cheap call against negative momentum and low volume
+    args = dict(ticker='TEST', strike=float(df['close'].iloc[-1]) * 1.10, option_type='CALL',
+                premium=0.30, dte=1, df=df, verbose=False)
+
+    early = qtc.quick_check(**args)
+    monkeypatch.setattr(qtc, 'MAX_DEFERRED_BONUS', {'CALL': 1000, 'PUT': 1000})
+    full = qtc.quick_check(**args)
+
+    assert "Fails basic checks - S/R and trend analysis skipped" in early['red_flags']
+    assert early['recommendation'] == full['recommendation'] == 'NO'
+    assert early['confidence'] < 30 and full['confidence'] < 30
+    for key in ('underlying_price', 'atr', 'volume_ratio'):
+        assert early[key] == full[key]
+    assert early['green_flags'] == full['green_flags'][:len(early['green_flags'])]
+    # No S/R on the early path, so no (fallback) stop level is reported
+    assert early['watch_levels'] == {}
+    assert early['sr_zones'] == {}
+
+
+def _rising_frame(n=63):
+    """Daily bars in a choppy uptrend on rising volume."""
+    rng = np.random.default_rng(3)
+    close = 100 + np.arange(n) * 0.3 + np.sin(np.arange(n) / 3) * 3 + rng.standard_normal(n) * 0.3
+    open_ = close + rng.standard_normal(n) * 0.3
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    volume = np.linspace(1e6, 3e6, n)
+    index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=n, freq='B')
+    return pd.DataFrame(
+        {'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume},
+        index=index
+    )
+
+
+def test_memoized_sr_zones_do_not_leak_between_checks(monkeypatch):
+    import copy
+    from collections import OrderedDict
+
+    monkeypatch.setattr(qtc, '_sr_memo', OrderedDict())
+    df = _rising_frame()
+    args = dict(ticker='TEST', strike=float(df['close'].iloc[-1]), option_type='CALL',
+                premium=2.50, dte=7, df=df, verbose=False)
+
+    first = qtc.quick_check(**args)
+    expected = copy.deepcopy(first['sr_zones'])
+    assert expected  # S/R ran, so the second check is a memo hit
+
+    first['sr_zones']['support_zones'].append({'price': 1.0})
+    first['sr_zones']['key_levels']['nearest_support'] = 0.0
+    second = qtc.quick_check(**args)
+
+    assert second['sr_zones'] == expected
+    assert len(qtc._sr_memo) == 1
+
+
+def test_batch_matches_single_checks_with_one_download(monkeypatch, tmp_path):
+    import sys
+    import types
+    from collections import OrderedDict
+
+    import src.utils.cache as cache_module
+
+    monkeypatch.setattr(cache_module, '_cache', cache_module.SimpleCache(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(qtc, '_sr_memo', OrderedDict())
+    bars = {'AAA': _rising_frame(), 'BBB': _falling_frame()}
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(tickers)
+        return pd.concat({t: bars[t].rename(columns=str.title) for t in tickers.split()}, axis=1)
+
+    monkeypatch.setitem(sys.modules, 'yfinance', types.SimpleNamespace(download=fake_download))
+    trades = [
+        dict(ticker='AAA', strike=float(bars['AAA']['close'].iloc[-1]), option_type='CALL', premium=2.50),
+        dict(ticker='BBB', strike=float(bars['BBB']['close'].iloc[-1]), option_type='PUT', premium=2.00),
+        dict(ticker='AAA', strike=float(bars['AAA']['close'].iloc[-1]) + 5, option_type='CALL', premium=1.00),
+    ]
+
+    results = qtc.quick_check_batch(trades)
+
+    assert calls == ['AAA BBB']
+    for trade, result in zip(trades, results):
+        expected = qtc.quick_check(**trade, df=bars[trade['ticker']], verbose=False)
+        assert result['recommendation'] == expected['recommendation']
+        assert result['confidence'] == expected['confidence']
+        assert result['red_flags'] == expected['red_flags']
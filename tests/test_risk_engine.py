@@ -0,0 +1,110 @@
+"""
+Tests for RiskEngine batch planning against the scalar trade plan
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+import risk_engine.risk_engine as risk_engine_module
+import utils.config as config_module
+from parser.trade_parser import OptionTrade
+from risk_engine.risk_engine import RiskEngine
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
+
+PLAN_FIELDS = ('stop_loss', 'stop_risk_pct', 'target_1', 'target_1_r', 'runner_contracts',
+               'runner_target', 'max_loss_dollars', 'max_gain_dollars')
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return RiskEngine(CONFIG_PATH)
+
+
+def _sample_trades(n=2000, seed=1):
+    rng = random.Random(seed)
+    return [
+        OptionTrade(
+            ticker='SPY',
+            option_type=rng.choice(['CALL', 'PUT']),
+            strike=500,
+            premium=round(rng.choice([rng.uniform(0.01, 1), rng.uniform(0.1, 80)]), 2),
+            is_ode=rng.random() < 0.4
+        )
+        for _ in range(n)
+    ]
+
+
+def _assert_matches_scalar(engine, trades, batch):
+    for i, trade in enumerate(trades):
+        plan = engine.create_trade_plan(trade)
+        assert batch.contracts[i] == plan.position.contracts
+        assert batch.risk_percentage[i] == plan.position.risk_percentage
+        for name in PLAN_FIELDS:
+            assert getattr(batch, name)[i] == getattr(plan, name), (name, trade.premium)
+        assert bool(batch.is_pass[i]) == (plan.go_no_go == 'GO')
+
+
+def test_batch_matches_scalar_plan(engine):
+    trades = _sample_trades()
+    _assert_matches_scalar(engine, trades, engine.create_trade_plans_batch(trades))
+
+
+def test_gpu_batch_matches_scalar_plan(engine, monkeypatch):
+    pytest.importorskip("cupy")
+    if risk_engine_module._gpu_backend() is None:
+        pytest.skip("No CUDA device")
+
+    monkeypatch.setattr(risk_engine_module, "_GPU_BATCH_THRESHOLD", 1)
+    trades = _sample_trades()
+    _assert_matches_scalar(engine, trades, engine.create_trade_plans_batch(trades))
+
+
+def test_parallel_batch_matches_plan_batch(engine):
+    rng = np.random.default_rng(5)
+    premiums = np.round(rng.uniform(0.01, 80, 10_000), 2)
+    is_ode = rng.random(10_000) < 0.4
+
+    expected = engine.plan_batch(premiums, is_ode)
+    result = engine.plan_batch_parallel(premiums, is_ode, workers=4, chunk_size=1_500)  # 7 chunks
+
+    for f in fields(expected):
+        np.testing.assert_array_equal(getattr(result, f.name), getattr(expected, f.name), err_msg=f.name)
+
+
+def test_clear_config_cache_reloads_edited_yaml(tmp_path, monkeypatch):
+    from collections import OrderedDict
+
+    monkeypatch.setattr(config_module, "_SIDECAR_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config_module, "_CONFIG_CACHE", OrderedDict())
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("account:\n  total_capital: 100000\n")
+    assert RiskEngine(str(config_path))._total_capital == 100000
+
+    # Same size and mtime, so only a forced reload can see the edit
+    st = config_path.stat()
+    config_path.write_text("account:\n  total_capital: 200000\n")
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert RiskEngine(str(config_path))._total_capital == 100000
+
+    RiskEngine.clear_config_cache()
+    assert RiskEngine(str(config_path))._total_capital == 200000
+
+
+def test_clear_caches_empties_engine_memos():
+    engine = RiskEngine(CONFIG_PATH)
+    engine._fixed_sizing(2.50)
+    engine._stop_levels(2.50, False)
+    memos = (engine._fixed_sizing, engine._stop_levels)
+    assert all(memo.cache_info().currsize == 1 for memo in memos)
+
+    engine.clear_caches()
+
+    assert all(memo.cache_info().currsize == 0 for memo in memos)